@@ -4,15 +4,24 @@ Open Voice - Speech-to-Text Mac Application
 Main entry point with complete recording flow
 """
 
+import logging
 import sys
-from PySide6.QtWidgets import QApplication
-from src.ui.main_window import MainWindow
-from src.services.di_container import DIContainer
-from src.services.hotkey_handler import MockHotkeyHandler
 
 
 def main():
     """Main application entry point"""
+    # Qt and the Qt-based services are imported here so importing this
+    # module doesn't load PySide6
+    from PySide6.QtWidgets import QApplication
+    from src.services.di_container import DIContainer
+    from src.services.hotkey_handler import MockHotkeyHandler
+    from src.ui.main_window import MainWindow
+
+    # Debug-level output from services stays off unless explicitly enabled
+    logging.basicConfig(
+        level=logging.INFO, format="%(levelname)s %(name)s: %(message)s"
+    )
+
     # Create Qt application
     app = QApplication(sys.argv)
 
@@ -1,14 +1,21 @@
 from src.interfaces.data_store import IDataStore, TranscriptEntry
-from typing import List, Optional
+from src.interfaces.audio_recorder import AudioBuffer
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
-import random
+from itertools import islice
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 
 class MockDataStore(IDataStore):
     """Mock data store for rapid development and testing"""
 
     def __init__(self):
-        self.transcripts = []
+        # Keyed by id for O(1) lookups; dict insertion order keeps entries
+        # oldest first, so reads iterate in reverse instead of sorting
+        self.transcripts: Dict[int, TranscriptEntry] = {}
         self.next_id = 1
 
     def _populate_sample_data(self):
@@ -22,20 +29,27 @@ class MockDataStore(IDataStore):
             "The quick brown fox jumps over the lazy dog.",
         ]
 
-        for i, text in enumerate(sample_texts):
-            timestamp = datetime.now() - timedelta(minutes=random.randint(1, 60))
-            duration = random.uniform(1.0, 8.0)
+        # Draw all offsets and durations in one go; sort offsets descending
+        # so insertion order stays chronological (oldest first)
+        rng = np.random.default_rng()
+        minutes_ago = np.sort(rng.integers(1, 61, size=len(sample_texts)))[::-1]
+        durations = rng.uniform(1.0, 8.0, size=len(sample_texts))
+        now = datetime.now()
+
+        for text, minutes, duration in zip(
+            sample_texts, minutes_ago.tolist(), durations.tolist()
+        ):
             entry = TranscriptEntry(
-                id=self.next_id,
-                original_text=text,
-                processed_text=text,
-                timestamp=timestamp,
-                duration=duration,
-                inserted_successfully=True,
-                audio_file_path=None,
-                provider_used="mock",
+                self.next_id,
+                text,
+                text,
+                now - timedelta(minutes=minutes),
+                duration,
+                True,
+                None,
+                "mock",
             )
-            self.transcripts.append(entry)
+            self.transcripts[entry.id] = entry
             self.next_id += 1
 
     def save_transcript(
@@ -57,57 +71,55 @@ class MockDataStore(IDataStore):
             audio_file_path=audio_file_path,
             provider_used=provider_used,
         )
-        self.transcripts.append(entry)
+        self.transcripts[entry.id] = entry
         self.next_id += 1
         return entry.id
 
     def get_transcripts(self, limit: int = 100) -> List[TranscriptEntry]:
         """Get recent transcript entries"""
         # Return most recent first
-        sorted_transcripts = sorted(
-            self.transcripts, key=lambda x: x.timestamp, reverse=True
-        )
-        return sorted_transcripts[:limit]
+        return list(islice(reversed(self.transcripts.values()), limit))
 
     def mark_insertion_status(self, transcript_id: int, success: bool) -> None:
         """Mark whether text insertion was successful"""
-        for transcript in self.transcripts:
-            if transcript.id == transcript_id:
-                transcript.inserted_successfully = success
-                break
+        transcript = self.transcripts.get(transcript_id)
+        if transcript:
+            transcript.inserted_successfully = success
 
     def delete_transcript(self, transcript_id: int) -> bool:
         """Delete a transcript entry and its audio file. Returns True if successful"""
-        for i, transcript in enumerate(self.transcripts):
-            if transcript.id == transcript_id:
-                del self.transcripts[i]
-                print(f"Deleted transcript {transcript_id}")
-                return True
-        print(f"Transcript {transcript_id} not found")
+        if self.transcripts.pop(transcript_id, None) is not None:
+            logger.debug("Deleted transcript %s", transcript_id)
+            return True
+        logger.debug("Transcript %s not found", transcript_id)
         return False
 
     def get_transcript_audio_path(self, transcript_id: int) -> Optional[str]:
         """Get the audio file path for a transcript"""
-        for transcript in self.transcripts:
-            if transcript.id == transcript_id:
-                return transcript.audio_file_path
-        return None
+        transcript = self.transcripts.get(transcript_id)
+        return transcript.audio_file_path if transcript else None
 
-    def save_audio_file(self, audio_data: bytes, transcript_id: int) -> Optional[str]:
+    def save_audio_file(
+        self, audio_data: AudioBuffer, transcript_id: int
+    ) -> Optional[str]:
         """Save audio data to file and return the file path (mock implementation)"""
         # Mock implementation - just return a fake path for testing
         fake_path = f"/tmp/mock_audio/transcript_{transcript_id}.wav"
-        print(f"Mock: Would save {len(audio_data)} bytes to {fake_path}")
+        logger.debug("Mock: Would save %d bytes to %s", len(audio_data), fake_path)
         return fake_path
 
     def update_audio_path(self, transcript_id: int, audio_file_path: str) -> bool:
         """Update the audio file path for a transcript (mock implementation)"""
-        for transcript in self.transcripts:
-            if transcript.id == transcript_id:
-                transcript.audio_file_path = audio_file_path
-                print(
-                    f"Mock: Updated audio path for transcript {transcript_id} to {audio_file_path}"
-                )
-                return True
-        print(f"Mock: Transcript {transcript_id} not found for audio path update")
+        transcript = self.transcripts.get(transcript_id)
+        if transcript:
+            transcript.audio_file_path = audio_file_path
+            logger.debug(
+                "Mock: Updated audio path for transcript %s to %s",
+                transcript_id,
+                audio_file_path,
+            )
+            return True
+        logger.debug(
+            "Mock: Transcript %s not found for audio path update", transcript_id
+        )
         return False
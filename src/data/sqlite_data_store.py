@@ -1,29 +1,70 @@
+import logging
 import sqlite3
 import os
+import sys
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from datetime import datetime
 from src.interfaces.data_store import IDataStore, TranscriptEntry
+from src.interfaces.audio_recorder import AudioBuffer
+from src.engines._wav import write_wav
+
+logger = logging.getLogger(__name__)
+
+
+_INSERT_TRANSCRIPT_SQL = """
+    INSERT INTO transcripts 
+    (original_text, processed_text, timestamp, duration, inserted_successfully, audio_file_path, provider_used)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _now_timestamp() -> str:
+    """Current time in the ISO format timestamps are stored in"""
+    return datetime.now().isoformat(" ")
+
+
+@lru_cache(maxsize=1)
+def _get_app_data_directory() -> Path:
+    """Get the application data directory for the current platform"""
+    if sys.platform == "darwin":  # macOS
+        return Path.home() / "Library" / "Application Support" / "OpenVoice"
+    elif os.name == "nt":  # Windows
+        return Path.home() / "AppData" / "Roaming" / "OpenVoice"
+    else:  # Linux and other POSIX systems
+        data_home = os.environ.get("XDG_DATA_HOME")
+        base_dir = Path(data_home) if data_home else Path.home() / ".local" / "share"
+        app_data_dir = base_dir / "OpenVoice"
+
+        # Earlier versions used the macOS path on every POSIX system; keep
+        # using existing data there until the XDG directory exists
+        legacy_dir = Path.home() / "Library" / "Application Support" / "OpenVoice"
+        if not app_data_dir.exists() and legacy_dir.exists():
+            logger.info("Using legacy data directory: %s", legacy_dir)
+            return legacy_dir
+
+        logger.info("Using data directory: %s", app_data_dir)
+        return app_data_dir
 
 
 class SQLiteDataStore(IDataStore):
     """SQLite-based data store for persistent transcript storage"""
 
     def __init__(self):
-        self.app_data_dir = self._get_app_data_directory()
+        self.app_data_dir = _get_app_data_directory()
         self.audio_dir = self.app_data_dir / "audio"
         self.db_path = self.app_data_dir / "transcripts.db"
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # Audio file deletes run off the caller's thread on a single worker
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="audio-io"
+        )
         self._initialize_storage()
 
-    def _get_app_data_directory(self) -> Path:
-        """Get the application data directory (Mac-compatible)"""
-        if os.name == "posix":  # macOS/Linux
-            app_data_dir = Path.home() / "Library" / "Application Support" / "OpenVoice"
-        else:  # Windows
-            app_data_dir = Path.home() / "AppData" / "Roaming" / "OpenVoice"
-
-        return app_data_dir
-
     def _initialize_storage(self):
         """Create database and audio directory if they don't exist"""
         try:
@@ -31,17 +72,44 @@ class SQLiteDataStore(IDataStore):
             self.app_data_dir.mkdir(parents=True, exist_ok=True)
             self.audio_dir.mkdir(exist_ok=True)
 
-            # Create database and tables
+            # Open the connection shared by all calls, then create tables
+            self._conn = self._open_connection()
             self._create_tables()
-            print(f"SQLite storage initialized at: {self.app_data_dir}")
+            logger.info("SQLite storage initialized at: %s", self.app_data_dir)
 
         except Exception as e:
-            print(f"Failed to initialize SQLite storage: {e}")
+            logger.error("Failed to initialize SQLite storage: %s", e)
             raise
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open the long-lived connection used for the lifetime of the store"""
+        # Autocommit mode; access is serialized through self._lock
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        # WAL + NORMAL sync: commits no longer fsync on every write
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    def close(self) -> None:
+        """Finish pending audio deletes and close the database connection"""
+        self._io_executor.shutdown(wait=True)
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def _create_tables(self):
         """Create database tables if they don't exist"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS transcripts (
@@ -65,8 +133,6 @@ class SQLiteDataStore(IDataStore):
             """
             )
 
-            conn.commit()
-
     def save_transcript(
         self,
         original_text: str,
@@ -77,17 +143,13 @@ class SQLiteDataStore(IDataStore):
     ) -> int:
         """Save a transcript entry and return its ID"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO transcripts 
-                    (original_text, processed_text, timestamp, duration, inserted_successfully, audio_file_path, provider_used)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+            with self._lock:
+                cursor = self._conn.execute(
+                    _INSERT_TRANSCRIPT_SQL,
                     (
                         original_text,
                         processed_text,
-                        datetime.now(),
+                        _now_timestamp(),
                         duration,
                         False,  # Will be updated later via mark_insertion_status
                         audio_file_path,
@@ -96,55 +158,161 @@ class SQLiteDataStore(IDataStore):
                 )
 
                 transcript_id = cursor.lastrowid
-                conn.commit()
 
-                print(f"Saved transcript {transcript_id}: '{original_text[:50]}...'")
+                logger.debug(
+                    "Saved transcript %s: '%.50s...'", transcript_id, original_text
+                )
                 return transcript_id
 
         except Exception as e:
-            print(f"Failed to save transcript: {e}")
+            logger.error("Failed to save transcript: %s", e)
+            raise
+
+    def save_transcripts(self, entries: Sequence[TranscriptEntry]) -> List[int]:
+        """Save several transcript entries in one transaction and return their IDs
+
+        Entry IDs are ignored; timestamps and statuses are kept as given.
+        """
+        if not entries:
+            return []
+
+        rows = [
+            (
+                entry.original_text,
+                entry.processed_text,
+                entry.timestamp,
+                entry.duration,
+                entry.inserted_successfully,
+                entry.audio_file_path,
+                entry.provider_used,
+            )
+            for entry in entries
+        ]
+
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(_INSERT_TRANSCRIPT_SQL, rows)
+                    cursor = self._conn.execute("SELECT last_insert_rowid()")
+                    last_id = cursor.fetchone()[0]
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+
+            # AUTOINCREMENT IDs from a single locked transaction are contiguous
+            first_id = last_id - len(rows) + 1
+            logger.debug("Saved %d transcripts", len(rows))
+            return list(range(first_id, last_id + 1))
+
+        except Exception as e:
+            logger.error("Failed to save transcripts: %s", e)
+            raise
+
+    def save_transcript_with_audio(
+        self,
+        original_text: str,
+        processed_text: str,
+        duration: float,
+        audio_data: AudioBuffer,
+        provider_used: str = "unknown",
+    ) -> Tuple[int, Optional[str]]:
+        """Save a transcript and its audio file in a single transaction"""
+        try:
+            with self._lock:
+                audio_file_path = None
+                self._conn.execute("BEGIN")
+                try:
+                    cursor = self._conn.execute(
+                        _INSERT_TRANSCRIPT_SQL,
+                        (
+                            original_text,
+                            processed_text,
+                            _now_timestamp(),
+                            duration,
+                            False,  # Will be updated later via mark_insertion_status
+                            None,
+                            provider_used,
+                        ),
+                    )
+                    transcript_id = cursor.lastrowid
+
+                    # Audio file name depends on the ID; it is written before
+                    # COMMIT so the row never points at a missing file
+                    audio_file_path = str(
+                        self.audio_dir / f"transcript_{transcript_id}.wav"
+                    )
+                    try:
+                        write_wav(audio_file_path, audio_data)
+                        self._conn.execute(
+                            "UPDATE transcripts SET audio_file_path = ? WHERE id = ?",
+                            (audio_file_path, transcript_id),
+                        )
+                    except Exception as e:
+                        # The transcript is kept without audio rather than lost
+                        logger.error("Failed to save audio file: %s", e)
+                        if os.path.exists(audio_file_path):
+                            os.remove(audio_file_path)
+                        audio_file_path = None
+
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    if audio_file_path and os.path.exists(audio_file_path):
+                        os.remove(audio_file_path)
+                    raise
+
+            logger.debug(
+                "Saved transcript %s: '%.50s...'", transcript_id, original_text
+            )
+            return transcript_id, audio_file_path
+
+        except Exception as e:
+            logger.error("Failed to save transcript: %s", e)
             raise
 
     def get_transcripts(self, limit: int = 100) -> List[TranscriptEntry]:
         """Get recent transcript entries"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row  # Enable column access by name
-
-                cursor = conn.execute(
+            with self._lock:
+                # Columns are selected in TranscriptEntry field order
+                cursor = self._conn.execute(
                     """
-                    SELECT * FROM transcripts 
+                    SELECT id, original_text, processed_text, timestamp, duration,
+                           inserted_successfully, audio_file_path, provider_used
+                    FROM transcripts 
                     ORDER BY timestamp DESC 
                     LIMIT ?
                 """,
                     (limit,),
                 )
-
-                transcripts = []
-                for row in cursor:
-                    entry = TranscriptEntry(
-                        id=row["id"],
-                        original_text=row["original_text"],
-                        processed_text=row["processed_text"],
-                        timestamp=datetime.fromisoformat(row["timestamp"]),
-                        duration=row["duration"],
-                        inserted_successfully=bool(row["inserted_successfully"]),
-                        audio_file_path=row["audio_file_path"],
-                        provider_used=row["provider_used"],
-                    )
-                    transcripts.append(entry)
-
-                return transcripts
+                rows = cursor.fetchall()
+
+            # Positional construction avoids building a kwargs dict per row
+            return [
+                TranscriptEntry(
+                    row[0],
+                    row[1],
+                    row[2],
+                    datetime.fromisoformat(row[3]),
+                    row[4],
+                    bool(row[5]),
+                    row[6],
+                    row[7],
+                )
+                for row in rows
+            ]
 
         except Exception as e:
-            print(f"Failed to get transcripts: {e}")
+            logger.error("Failed to get transcripts: %s", e)
             return []
 
     def mark_insertion_status(self, transcript_id: int, success: bool) -> None:
         """Mark whether text insertion was successful"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
+            with self._lock:
+                self._conn.execute(
                     """
                     UPDATE transcripts 
                     SET inserted_successfully = ?
@@ -153,10 +321,8 @@ class SQLiteDataStore(IDataStore):
                     (success, transcript_id),
                 )
 
-                conn.commit()
-
         except Exception as e:
-            print(f"Failed to update insertion status: {e}")
+            logger.error("Failed to update insertion status: %s", e)
 
     def delete_transcript(self, transcript_id: int) -> bool:
         """Delete a transcript entry and its audio file. Returns True if successful"""
@@ -165,8 +331,8 @@ class SQLiteDataStore(IDataStore):
             audio_path = self.get_transcript_audio_path(transcript_id)
 
             # Delete from database
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
+            with self._lock:
+                cursor = self._conn.execute(
                     """
                     DELETE FROM transcripts WHERE id = ?
                 """,
@@ -174,31 +340,25 @@ class SQLiteDataStore(IDataStore):
                 )
 
                 if cursor.rowcount == 0:
-                    print(f"Transcript {transcript_id} not found")
+                    logger.debug("Transcript %s not found", transcript_id)
                     return False
 
-                conn.commit()
-
-            # Delete audio file if it exists
-            if audio_path and os.path.exists(audio_path):
-                try:
-                    os.remove(audio_path)
-                    print(f"Deleted audio file: {audio_path}")
-                except Exception as e:
-                    print(f"Failed to delete audio file {audio_path}: {e}")
+            # Delete audio file in the background
+            if audio_path:
+                self._io_executor.submit(self._delete_audio_file, audio_path)
 
-            print(f"Deleted transcript {transcript_id}")
+            logger.debug("Deleted transcript %s", transcript_id)
             return True
 
         except Exception as e:
-            print(f"Failed to delete transcript {transcript_id}: {e}")
+            logger.error("Failed to delete transcript %s: %s", transcript_id, e)
             return False
 
     def get_transcript_audio_path(self, transcript_id: int) -> Optional[str]:
         """Get the audio file path for a transcript"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
+            with self._lock:
+                cursor = self._conn.execute(
                     """
                     SELECT audio_file_path FROM transcripts WHERE id = ?
                 """,
@@ -209,30 +369,42 @@ class SQLiteDataStore(IDataStore):
                 return row[0] if row else None
 
         except Exception as e:
-            print(f"Failed to get audio path for transcript {transcript_id}: {e}")
+            logger.error(
+                "Failed to get audio path for transcript %s: %s", transcript_id, e
+            )
             return None
 
-    def save_audio_file(self, audio_data: bytes, transcript_id: int) -> Optional[str]:
+    def save_audio_file(
+        self, audio_data: AudioBuffer, transcript_id: int
+    ) -> Optional[str]:
         """Save audio data to file and return the file path"""
         try:
             audio_filename = f"transcript_{transcript_id}.wav"
-            audio_path = self.audio_dir / audio_filename
+            audio_path = str(self.audio_dir / audio_filename)
 
-            with open(audio_path, "wb") as f:
-                f.write(audio_data)
-
-            print(f"Saved audio file: {audio_path}")
-            return str(audio_path)
+            # Written before returning, so the path never names a missing file
+            write_wav(audio_path, audio_data)
+            logger.debug("Saved audio file: %s", audio_path)
+            return audio_path
 
         except Exception as e:
-            print(f"Failed to save audio file: {e}")
+            logger.error("Failed to save audio file: %s", e)
             return None
 
+    def _delete_audio_file(self, audio_path: str) -> None:
+        """Delete an audio file if it exists (runs on the audio IO worker)"""
+        if os.path.exists(audio_path):
+            try:
+                os.remove(audio_path)
+                logger.debug("Deleted audio file: %s", audio_path)
+            except Exception as e:
+                logger.error("Failed to delete audio file %s: %s", audio_path, e)
+
     def update_audio_path(self, transcript_id: int, audio_file_path: str) -> bool:
         """Update the audio file path for a transcript"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
+            with self._lock:
+                cursor = self._conn.execute(
                     """
                     UPDATE transcripts 
                     SET audio_file_path = ?
@@ -242,54 +414,56 @@ class SQLiteDataStore(IDataStore):
                 )
 
                 if cursor.rowcount == 0:
-                    print(f"Transcript {transcript_id} not found for audio path update")
+                    logger.debug(
+                        "Transcript %s not found for audio path update", transcript_id
+                    )
                     return False
 
-                conn.commit()
-                print(f"Updated audio path for transcript {transcript_id}")
+                logger.debug("Updated audio path for transcript %s", transcript_id)
                 return True
 
         except Exception as e:
-            print(f"Failed to update audio path for transcript {transcript_id}: {e}")
+            logger.error(
+                "Failed to update audio path for transcript %s: %s", transcript_id, e
+            )
             return False
 
     def get_storage_stats(self) -> dict:
         """Get storage statistics for debugging/monitoring"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("SELECT COUNT(*) FROM transcripts")
-                total_transcripts = cursor.fetchone()[0]
-
-                cursor = conn.execute(
-                    "SELECT COUNT(*) FROM transcripts WHERE inserted_successfully = 1"
-                )
-                successful_insertions = cursor.fetchone()[0]
-
-                # Calculate total audio files
-                audio_files = (
-                    len(list(self.audio_dir.glob("*.wav")))
-                    if self.audio_dir.exists()
-                    else 0
-                )
-
-                # Calculate storage size
-                db_size = self.db_path.stat().st_size if self.db_path.exists() else 0
-                audio_size = (
-                    sum(f.stat().st_size for f in self.audio_dir.glob("*.wav"))
-                    if self.audio_dir.exists()
-                    else 0
+            with self._lock:
+                cursor = self._conn.execute(
+                    """
+                    SELECT COUNT(*),
+                           COALESCE(SUM(CASE WHEN inserted_successfully THEN 1 ELSE 0 END), 0)
+                    FROM transcripts
+                """
                 )
-
-                return {
-                    "total_transcripts": total_transcripts,
-                    "successful_insertions": successful_insertions,
-                    "audio_files": audio_files,
-                    "database_size_bytes": db_size,
-                    "audio_size_bytes": audio_size,
-                    "total_size_bytes": db_size + audio_size,
-                    "storage_path": str(self.app_data_dir),
-                }
+                total_transcripts, successful_insertions = cursor.fetchone()
+
+            # Count and size audio files in a single directory pass
+            audio_files = 0
+            audio_size = 0
+            if self.audio_dir.exists():
+                with os.scandir(self.audio_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".wav") and entry.is_file():
+                            audio_files += 1
+                            audio_size += entry.stat().st_size
+
+            # Calculate storage size
+            db_size = self.db_path.stat().st_size if self.db_path.exists() else 0
+
+            return {
+                "total_transcripts": total_transcripts,
+                "successful_insertions": successful_insertions,
+                "audio_files": audio_files,
+                "database_size_bytes": db_size,
+                "audio_size_bytes": audio_size,
+                "total_size_bytes": db_size + audio_size,
+                "storage_path": str(self.app_data_dir),
+            }
 
         except Exception as e:
-            print(f"Failed to get storage stats: {e}")
+            logger.error("Failed to get storage stats: %s", e)
             return {}
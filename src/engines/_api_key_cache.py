@@ -0,0 +1,24 @@
+from src.interfaces.settings import ISettingsManager
+
+
+class ApiKeyCache:
+    """Cache of a provider's API key, refreshed only when settings change"""
+
+    __slots__ = ("provider", "_key", "_version")
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self._key = ""
+        self._version = -1
+
+    def get(self, settings: ISettingsManager) -> str:
+        """Get the stripped API key, re-reading it after any settings change"""
+        version = settings.get_settings_version()
+        if version != self._version:
+            self._key = (settings.get_provider_api_key(self.provider) or "").strip()
+            self._version = version
+        return self._key
+
+    def invalidate(self) -> None:
+        """Force the next lookup to read from settings"""
+        self._version = -1
@@ -0,0 +1,27 @@
+import threading
+import numpy as np
+
+# Per-thread scratch buffers, grown on demand and reused across calls so
+# steady-state transcription doesn't allocate a new float32 array each time
+_local = threading.local()
+
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def get_float32(size: int) -> np.ndarray:
+    """Get a float32 scratch array of `size` elements owned by this thread"""
+    buffer = getattr(_local, "float32", None)
+    if buffer is None or buffer.size < size:
+        buffer = _local.float32 = np.empty(size, dtype=np.float32)
+    return buffer[:size]
+
+
+def pcm_to_float32(pcm: bytes) -> np.ndarray:
+    """Convert 16-bit PCM to float32 samples in [-1, 1) using a pooled buffer
+
+    The result is only valid until the next call on the same thread.
+    """
+    samples = np.frombuffer(pcm, dtype=np.int16)
+    out = get_float32(samples.size)
+    np.multiply(samples, _INT16_SCALE, out=out)
+    return out
@@ -0,0 +1,20 @@
+import re
+
+# Single precompiled scan over the error text instead of chained substring checks
+_API_ERROR_RE = re.compile(r"invalid api key|unauthorized|quota|rate limit", re.I)
+
+_API_ERROR_MESSAGES = {
+    "invalid api key": "Invalid {provider} API key",
+    "unauthorized": "Invalid {provider} API key",
+    "quota": "{provider} API quota exceeded",
+    "rate limit": "{provider} API rate limit exceeded",
+}
+
+
+def classify_api_error(provider: str, error: Exception) -> str:
+    """Turn a provider SDK exception into a short user-facing message"""
+    message = str(error)
+    match = _API_ERROR_RE.search(message)
+    if match is None:
+        return f"{provider} error: {message}"
+    return _API_ERROR_MESSAGES[match.group(0).lower()].format(provider=provider)
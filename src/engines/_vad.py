@@ -0,0 +1,22 @@
+import numpy as np
+from src.engines._wav import SAMPLE_RATE
+
+# Clips shorter than this can't hold a meaningful utterance
+_MIN_SPEECH_SAMPLES = SAMPLE_RATE // 4  # 250 ms
+
+# RMS of int16 samples below which a clip is treated as silence
+_SPEECH_RMS_THRESHOLD = 500.0
+
+
+def has_speech(pcm: bytes) -> bool:
+    """Cheap energy gate: False for clips too short or too quiet to transcribe"""
+    # A trailing odd byte is not a whole sample, so it is ignored
+    view = memoryview(pcm).cast("B")
+    samples = np.frombuffer(view, dtype=np.int16, count=view.nbytes // 2)
+    if samples.size < _MIN_SPEECH_SAMPLES:
+        return False
+
+    # Compare mean energy against the squared threshold to skip the sqrt
+    as_float = samples.astype(np.float32)
+    mean_energy = float(np.dot(as_float, as_float)) / samples.size
+    return mean_energy >= _SPEECH_RMS_THRESHOLD * _SPEECH_RMS_THRESHOLD
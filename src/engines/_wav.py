@@ -0,0 +1,121 @@
+import io
+import os
+import struct
+from src.interfaces.audio_recorder import AudioBuffer
+
+# Audio parameters (matching our recorder settings)
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2  # 16-bit = 2 bytes
+CHANNELS = 1  # Mono
+
+# RIFF header, "fmt " chunk (PCM) and "data" chunk header: 44 bytes total
+_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _make_header(data_len: int, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """Build the WAV header for data_len bytes of PCM"""
+    return _HEADER.pack(
+        b"RIFF",
+        36 + data_len,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        CHANNELS,
+        sample_rate,
+        sample_rate * CHANNELS * SAMPLE_WIDTH,  # byte rate
+        CHANNELS * SAMPLE_WIDTH,  # block align
+        SAMPLE_WIDTH * 8,  # bits per sample
+        b"data",
+        data_len,
+    )
+
+
+def write_wav(
+    path: str, audio_bytes: AudioBuffer, sample_rate: int = SAMPLE_RATE
+) -> None:
+    """Write raw 16-bit mono PCM to a WAV file straight from the given buffer
+
+    Header and PCM go to the file descriptor in one vectored write where the
+    OS has writev, so the audio is never concatenated or copied into Python's
+    buffered file layer.
+    """
+    audio = memoryview(audio_bytes).cast("B")
+    chunks = [memoryview(_make_header(len(audio), sample_rate)), audio]
+
+    fd = os.open(path, _FILE_FLAGS, 0o644)
+    try:
+        while chunks:
+            if hasattr(os, "writev"):
+                written = os.writev(fd, chunks)
+            else:
+                written = os.write(fd, chunks[0])
+
+            # Drop fully written chunks, then trim a partially written one
+            while chunks and written >= len(chunks[0]):
+                written -= len(chunks[0])
+                chunks.pop(0)
+            if written:
+                chunks[0] = chunks[0][written:]
+    finally:
+        os.close(fd)
+
+
+class WavStream(io.RawIOBase):
+    """Read-only WAV file object over raw PCM bytes, without copying them"""
+
+    def __init__(self, audio_bytes: AudioBuffer):
+        super().__init__()
+        # Byte view first, so sizes are in bytes even for non-byte formats
+        self._audio = memoryview(audio_bytes).cast("B")
+        self._header = _make_header(len(self._audio))
+        self._size = len(self._header) + len(self._audio)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        out = memoryview(buffer).cast("B")
+        header_len = len(self._header)
+        pos = self._pos
+        written = 0
+
+        # Header first, then a slice of the PCM view
+        if pos < header_len:
+            chunk = self._header[pos : pos + len(out)]
+            out[: len(chunk)] = chunk
+            written = len(chunk)
+            pos += written
+
+        if written < len(out) and pos < self._size:
+            start = pos - header_len
+            chunk = self._audio[start : start + len(out) - written]
+            out[written : written + len(chunk)] = chunk
+            written += len(chunk)
+            pos += len(chunk)
+
+        self._pos = pos
+        return written
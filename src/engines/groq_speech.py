@@ -1,11 +1,13 @@
-import io
-import wave
-import tempfile
-import os
-from typing import Optional
-from groq import Groq
+import logging
 from src.interfaces.speech import ISpeechEngine
+from src.interfaces.audio_recorder import AudioBuffer
 from src.interfaces.settings import ISettingsManager
+from src.engines._wav import WavStream
+from src.engines._api_key_cache import ApiKeyCache
+from src.engines._errors import classify_api_error
+from src.services.http_pool import get_http_client
+
+logger = logging.getLogger(__name__)
 
 
 class GroqSpeechEngine(ISpeechEngine):
@@ -14,24 +16,30 @@ class GroqSpeechEngine(ISpeechEngine):
     def __init__(self, settings_manager: ISettingsManager):
         self.settings_manager = settings_manager
         self.client = None
+        self._api_key_cache = ApiKeyCache("groq")
         self._initialize_client()
-        print("Groq speech engine initialized")
+        logger.debug("Groq speech engine initialized")
 
     def _initialize_client(self):
         """Initialize Groq client with API key"""
         try:
+            # Imported here so the SDK only loads when this engine is used
+            from groq import Groq
+
             api_key = self.settings_manager.get_provider_api_key("groq")
             if api_key and api_key.strip():
-                self.client = Groq(api_key=api_key.strip())
-                print("Groq client initialized")
+                self.client = Groq(
+                    api_key=api_key.strip(), http_client=get_http_client()
+                )
+                logger.debug("Groq client initialized")
             else:
-                print("No Groq API key provided")
+                logger.warning("No Groq API key provided")
                 self.client = None
         except Exception as e:
-            print(f"Failed to initialize Groq client: {e}")
+            logger.error("Failed to initialize Groq client: %s", e)
             self.client = None
 
-    def transcribe(self, audio_data: bytes) -> str:
+    def transcribe(self, audio_data: AudioBuffer) -> str:
         """Convert audio data to text using Groq Whisper"""
         try:
             if not audio_data:
@@ -42,60 +50,33 @@ class GroqSpeechEngine(ISpeechEngine):
                 if not self.client:
                     return "Groq API key not configured"
 
-            print(f"Processing {len(audio_data)} bytes with Groq Whisper...")
-
-            # Convert raw audio bytes to WAV format for Groq
-            wav_data = self._bytes_to_wav(audio_data)
-            if not wav_data:
-                return "Failed to process audio format"
-
-            # Create temporary file for Groq API
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_file.write(wav_data)
-                temp_file_path = temp_file.name
-
-            try:
-                # Call Groq Whisper API
-                with open(temp_file_path, "rb") as audio_file:
-                    response = self.client.audio.transcriptions.create(
-                        model="whisper-large-v3",
-                        file=audio_file,
-                        response_format="text",
-                    )
-
-                text = response.strip() if response else ""
-
-                if text:
-                    print(f"Groq Whisper transcribed: '{text}'")
-                    return text
-                else:
-                    return "Could not understand audio"
-
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
+            logger.debug("Processing %d bytes with Groq Whisper...", len(audio_data))
 
-        except Exception as e:
-            print(f"Groq Whisper error: {e}")
-
-            # Check for common API errors
-            if "Invalid API key" in str(e) or "Unauthorized" in str(e):
-                return "Invalid Groq API key"
-            elif "quota" in str(e).lower():
-                return "Groq API quota exceeded"
-            elif "rate limit" in str(e).lower():
-                return "Groq API rate limit exceeded"
+            # Stream header + PCM straight from memory as a WAV file; the SDK
+            # only needs a filename for the format
+            audio_file = ("audio.wav", WavStream(audio_data), "audio/wav")
+            response = self.client.audio.transcriptions.create(
+                model="whisper-large-v3",
+                file=audio_file,
+                response_format="text",
+            )
+
+            text = response.strip() if response else ""
+
+            if text:
+                logger.debug("Groq Whisper transcribed: '%s'", text)
+                return text
             else:
-                return f"Groq error: {str(e)}"
+                return "Could not understand audio"
+
+        except Exception as e:
+            logger.error("Groq Whisper error: %s", e)
+            return classify_api_error("Groq", e)
 
     def is_available(self) -> bool:
         """Check if Groq Whisper is available"""
         try:
-            api_key = self.settings_manager.get_provider_api_key("groq")
-            if not api_key or not api_key.strip():
+            if not self._api_key_cache.get(self.settings_manager):
                 return False
 
             if not self.client:
@@ -104,36 +85,13 @@ class GroqSpeechEngine(ISpeechEngine):
             return self.client is not None
 
         except Exception as e:
-            print(f"Groq availability check failed: {e}")
+            logger.error("Groq availability check failed: %s", e)
             return False
 
-    def _bytes_to_wav(self, audio_bytes: bytes) -> Optional[bytes]:
-        """Convert raw audio bytes to WAV format for Groq API"""
-        try:
-            # Audio parameters (matching our recorder settings)
-            sample_rate = 16000
-            sample_width = 2  # 16-bit = 2 bytes
-            channels = 1  # Mono
-
-            # Create WAV file in memory
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, "wb") as wav_file:
-                wav_file.setnchannels(channels)
-                wav_file.setsampwidth(sample_width)
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(audio_bytes)
-
-            # Get WAV data
-            wav_data = wav_buffer.getvalue()
-            return wav_data
-
-        except Exception as e:
-            print(f"WAV conversion error: {e}")
-            return None
-
     def update_api_key(self, api_key: str):
         """Update the Groq API key"""
         self.settings_manager.set_provider_api_key("groq", api_key)
+        self._api_key_cache.invalidate()
         self._initialize_client()
 
     def get_model_info(self) -> dict:
@@ -1,10 +1,68 @@
-import io
-import wave
+import logging
+import threading
 import numpy as np
-from typing import Optional
-from faster_whisper import WhisperModel
+from typing import Any, Dict, Optional, Tuple
 from src.interfaces.speech import ISpeechEngine
+from src.interfaces.audio_recorder import AudioBuffer
 from src.interfaces.settings import ISettingsManager
+from src.engines._bufpool import pcm_to_float32
+
+logger = logging.getLogger(__name__)
+
+# Sizes that ship an English-only (".en") variant
+_ENGLISH_ONLY_SIZES = {"tiny", "base", "small", "medium"}
+
+# Loaded models shared across engine instances, keyed by
+# (model name, device, compute type). Each model is paired with an event
+# that is set once its warmup inference has finished.
+_model_cache: Dict[Tuple[str, str, str], Tuple[Any, threading.Event]] = {}
+# Per-key locks so a model is built once without blocking loads of other keys
+_model_load_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+_model_cache_lock = threading.Lock()
+
+# Longest a transcription waits for the warmup before running alongside it
+_WARMUP_WAIT_TIMEOUT = 10.0
+
+
+def _load_model(
+    model_name: str, device: str, compute_type: str
+) -> Tuple[Any, threading.Event]:
+    """Load a WhisperModel, reusing an already loaded one when possible"""
+    key = (model_name, device, compute_type)
+    with _model_cache_lock:
+        entry = _model_cache.get(key)
+        if entry is not None:
+            return entry
+        load_lock = _model_load_locks.setdefault(key, threading.Lock())
+
+    # Built outside the cache lock, which only guards the dictionaries
+    with load_lock:
+        entry = _model_cache.get(key)
+        if entry is None:
+            # Imported here so ctranslate2 only loads when this engine is used
+            from faster_whisper import WhisperModel
+
+            model = WhisperModel(model_name, device=device, compute_type=compute_type)
+            entry = (model, threading.Event())
+            with _model_cache_lock:
+                _model_cache[key] = entry
+            threading.Thread(target=_warm_up_model, args=entry, daemon=True).start()
+        return entry
+
+
+def _warm_up_model(model, ready: threading.Event):
+    """Run one short inference so the first real transcription doesn't stall"""
+    try:
+        # Weights are paged in and kernels initialised on first use
+        segments, _ = model.transcribe(
+            np.zeros(16000, dtype=np.float32), beam_size=1, language="en"
+        )
+        for _ in segments:
+            pass
+    except Exception as e:
+        logger.error("Local Whisper warmup failed: %s", e)
+    finally:
+        ready.set()
 
 
 class LocalWhisperEngine(ISpeechEngine):
@@ -13,28 +71,43 @@ class LocalWhisperEngine(ISpeechEngine):
     def __init__(self, settings_manager: ISettingsManager):
         self.settings_manager = settings_manager
         self.model = None
+        self._model_ready: Optional[threading.Event] = None
         self.model_size = "base"  # Default model size
+        self._detected_language: Optional[str] = None
         self._initialize_model()
-        print("Local Whisper engine initialized")
+        logger.debug("Local Whisper engine initialized")
 
     def _initialize_model(self):
         """Initialize local Whisper model"""
         try:
-            print(f"Loading local Whisper model: {self.model_size}")
-
-            # Initialize faster-whisper model
-            # compute_type="int8" for CPU, "float16" for GPU
-            self.model = WhisperModel(
-                self.model_size, device="cpu", compute_type="int8"
+            options = self.settings_manager.get_local_whisper_settings()
+            self.model_size = options.get("model_size", "base")
+
+            # English-only variants are smaller and more accurate on English
+            if (
+                options.get("language") == "en"
+                and self.model_size in _ENGLISH_ONLY_SIZES
+            ):
+                self.model_size += ".en"
+
+            logger.info("Loading local Whisper model: %s", self.model_size)
+
+            # "auto" picks CUDA when present and the fastest precision the
+            # hardware supports; int8 can be slower than float32 on CPUs
+            # without VNNI, so it is no longer forced
+            self.model, self._model_ready = _load_model(
+                self.model_size,
+                options.get("device", "auto"),
+                options.get("compute_type", "auto"),
             )
 
-            print(f"Local Whisper model loaded: {self.model_size}")
+            logger.debug("Local Whisper model loaded: %s", self.model_size)
 
         except Exception as e:
-            print(f"Failed to initialize local Whisper model: {e}")
+            logger.error("Failed to initialize local Whisper model: %s", e)
             self.model = None
 
-    def transcribe(self, audio_data: bytes) -> str:
+    def transcribe(self, audio_data: AudioBuffer) -> str:
         """Convert audio data to text using local Whisper"""
         try:
             if not audio_data:
@@ -45,55 +118,60 @@ class LocalWhisperEngine(ISpeechEngine):
                 if not self.model:
                     return "Local Whisper model not available"
 
-            print(f"Processing {len(audio_data)} bytes with local Whisper...")
+            # Don't race the background warmup for the model, but don't let
+            # a stuck warmup block transcription either
+            if not self._model_ready.wait(timeout=_WARMUP_WAIT_TIMEOUT):
+                logger.warning(
+                    "Local Whisper warmup still running after %.0fs, continuing",
+                    _WARMUP_WAIT_TIMEOUT,
+                )
 
-            # Convert raw audio bytes to WAV format for Whisper
-            wav_data = self._bytes_to_wav(audio_data)
-            if not wav_data:
-                return "Failed to process audio format"
+            logger.debug("Processing %d bytes with local Whisper...", len(audio_data))
+
+            # faster-whisper takes 16kHz mono float32 samples directly, so
+            # skip the WAV container, temp file and libav decode. The array
+            # is a pooled buffer; segments are fully consumed below.
+            audio_np = pcm_to_float32(audio_data)
+
+            # Language detection costs an extra encoder pass, so only run it
+            # until a language is configured or confidently detected
+            options = self.settings_manager.get_local_whisper_settings()
+            language = options.get("language") or self._detected_language
+
+            # Transcribe using local Whisper
+            segments, info = self.model.transcribe(
+                audio_np,
+                beam_size=options.get("beam_size", 1),
+                best_of=1,
+                temperature=0.0,  # No fallback temperature sweep
+                without_timestamps=True,
+                language=language,
+                condition_on_previous_text=False,  # One-shot dictation
+            )
 
-            # Create temporary file-like object for Whisper
-            import tempfile
-            import os
+            # Collect all segments
+            transcript = ""
+            for segment in segments:
+                transcript += segment.text
 
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_file.write(wav_data)
-                temp_file_path = temp_file.name
+            text = transcript.strip()
 
-            try:
-                # Transcribe using local Whisper
-                segments, info = self.model.transcribe(
-                    temp_file_path,
-                    beam_size=5,
-                    language=None,  # Auto-detect language
-                    condition_on_previous_text=True,
-                )
+            if language is None and info.language_probability > 0.8:
+                self._detected_language = info.language
 
-                # Collect all segments
-                transcript = ""
-                for segment in segments:
-                    transcript += segment.text
-
-                text = transcript.strip()
-
-                if text:
-                    print(f"Local Whisper transcribed: '{text}'")
-                    print(
-                        f"   Language: {info.language} (probability: {info.language_probability:.2f})"
-                    )
-                    return text
-                else:
-                    return "Could not understand audio"
-
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
+            if text:
+                logger.debug("Local Whisper transcribed: '%s'", text)
+                logger.debug(
+                    "   Language: %s (probability: %.2f)",
+                    info.language,
+                    info.language_probability,
+                )
+                return text
+            else:
+                return "Could not understand audio"
 
         except Exception as e:
-            print(f"Local Whisper error: {e}")
+            logger.error("Local Whisper error: %s", e)
             return f"Local Whisper error: {str(e)}"
 
     def is_available(self) -> bool:
@@ -106,33 +184,9 @@ class LocalWhisperEngine(ISpeechEngine):
             return self.model is not None
 
         except Exception as e:
-            print(f"Local Whisper availability check failed: {e}")
+            logger.error("Local Whisper availability check failed: %s", e)
             return False
 
-    def _bytes_to_wav(self, audio_bytes: bytes) -> Optional[bytes]:
-        """Convert raw audio bytes to WAV format for Whisper"""
-        try:
-            # Audio parameters (matching our recorder settings)
-            sample_rate = 16000
-            sample_width = 2  # 16-bit = 2 bytes
-            channels = 1  # Mono
-
-            # Create WAV file in memory
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, "wb") as wav_file:
-                wav_file.setnchannels(channels)
-                wav_file.setsampwidth(sample_width)
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(audio_bytes)
-
-            # Get WAV data
-            wav_data = wav_buffer.getvalue()
-            return wav_data
-
-        except Exception as e:
-            print(f"WAV conversion error: {e}")
-            return None
-
     def get_model_info(self) -> dict:
         """Get information about the local Whisper model"""
         return {
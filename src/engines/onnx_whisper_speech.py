@@ -0,0 +1,155 @@
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+from src.interfaces.speech import ISpeechEngine
+from src.interfaces.audio_recorder import AudioBuffer
+from src.interfaces.settings import ISettingsManager
+from src.engines._wav import SAMPLE_RATE
+from src.engines._bufpool import pcm_to_float32
+
+logger = logging.getLogger(__name__)
+
+# File name patterns of the INT8 exports published with sherpa-onnx, e.g.
+# base.en-encoder.int8.onnx, base.en-decoder.int8.onnx, base.en-tokens.txt
+_MODEL_FILE_PATTERNS = ("*encoder.int8.onnx", "*decoder.int8.onnx", "*tokens.txt")
+
+# sherpa-onnx Whisper decodes at most 30 seconds of audio per stream
+_WINDOW_SAMPLES = 30 * SAMPLE_RATE
+
+# Marks that no model lookup has failed yet (None is a valid model_dir)
+_NOT_FAILED = object()
+
+
+def find_model_files(model_dir: Optional[str]) -> Optional[Tuple[str, str, str]]:
+    """Locate the (encoder, decoder, tokens) files in an ONNX Whisper model dir"""
+    if not model_dir:
+        return None
+
+    directory = Path(model_dir).expanduser()
+    found = []
+    for pattern in _MODEL_FILE_PATTERNS:
+        matches = sorted(directory.glob(pattern))
+        if not matches:
+            return None
+        found.append(str(matches[0]))
+    return found[0], found[1], found[2]
+
+
+class OnnxWhisperEngine(ISpeechEngine):
+    """Local Whisper engine running INT8 ONNX models on ONNX Runtime via sherpa-onnx"""
+
+    def __init__(self, settings_manager: ISettingsManager):
+        self.settings_manager = settings_manager
+        self.recognizer = None
+        self.model_dir: Optional[str] = None
+        # Model dir of the last failed load, retried only once it changes
+        self._failed_model_dir = _NOT_FAILED
+        self._initialize_recognizer()
+        logger.debug("ONNX Whisper engine initialized")
+
+    def _initialize_recognizer(self):
+        """Load the ONNX encoder/decoder from the configured model directory"""
+        try:
+            options = self.settings_manager.get_local_whisper_settings()
+            self.model_dir = options.get("onnx_model_dir")
+            if self.model_dir == self._failed_model_dir:
+                return
+
+            model_files = find_model_files(self.model_dir)
+            if model_files is None:
+                if self.model_dir:
+                    logger.warning(
+                        "No ONNX Whisper model found in: %s", self.model_dir
+                    )
+                else:
+                    logger.debug("No ONNX Whisper model directory configured")
+                self._failed_model_dir = self.model_dir
+                self.recognizer = None
+                return
+
+            # Imported here so onnxruntime only loads when this engine is used
+            import sherpa_onnx
+
+            encoder, decoder, tokens = model_files
+            logger.info("Loading ONNX Whisper model from: %s", self.model_dir)
+
+            # ONNX Runtime's CPU provider uses MLAS INT8 GEMM kernels (VNNI
+            # where available); an empty language lets the model detect it
+            self.recognizer = sherpa_onnx.OfflineRecognizer.from_whisper(
+                encoder=encoder,
+                decoder=decoder,
+                tokens=tokens,
+                language=options.get("language") or "",
+                task="transcribe",
+                num_threads=os.cpu_count() or 1,
+                provider="cpu",
+            )
+
+            self._failed_model_dir = _NOT_FAILED
+
+        except Exception as e:
+            logger.error("Failed to initialize ONNX Whisper model: %s", e)
+            self._failed_model_dir = self.model_dir
+            self.recognizer = None
+
+    def transcribe(self, audio_data: AudioBuffer) -> str:
+        """Convert audio data to text using the ONNX Whisper model"""
+        try:
+            if not audio_data:
+                return "No audio data received"
+
+            if not self.recognizer:
+                self._initialize_recognizer()
+                if not self.recognizer:
+                    return "ONNX Whisper model not available"
+
+            logger.debug("Processing %d bytes with ONNX Whisper...", len(audio_data))
+
+            # accept_waveform copies the samples, so a pooled buffer is safe
+            samples = pcm_to_float32(audio_data)
+
+            # Longer dictations are decoded in 30-second windows and joined
+            texts = []
+            for start in range(0, len(samples), _WINDOW_SAMPLES):
+                stream = self.recognizer.create_stream()
+                stream.accept_waveform(
+                    SAMPLE_RATE, samples[start : start + _WINDOW_SAMPLES]
+                )
+                self.recognizer.decode_stream(stream)
+                window_text = stream.result.text.strip()
+                if window_text:
+                    texts.append(window_text)
+            text = " ".join(texts)
+
+            if text:
+                logger.debug("ONNX Whisper transcribed: '%s'", text)
+                return text
+            else:
+                return "Could not understand audio"
+
+        except Exception as e:
+            logger.error("ONNX Whisper error: %s", e)
+            return f"ONNX Whisper error: {str(e)}"
+
+    def is_available(self) -> bool:
+        """Check if the ONNX Whisper model is loaded"""
+        try:
+            if self.recognizer is None:
+                self._initialize_recognizer()
+
+            return self.recognizer is not None
+
+        except Exception as e:
+            logger.error("ONNX Whisper availability check failed: %s", e)
+            return False
+
+    def get_model_info(self) -> dict:
+        """Get information about the ONNX Whisper model"""
+        return {
+            "name": "Local Whisper (ONNX)",
+            "model": self.model_dir,
+            "provider": "Local",
+            "requires_internet": False,
+            "requires_api_key": False,
+        }
@@ -1,15 +1,21 @@
-import speech_recognition as sr
-import io
-import numpy as np
-import wave
-from typing import Optional
+import logging
+from typing import TYPE_CHECKING, Optional
 from src.interfaces.speech import ISpeechEngine
+from src.interfaces.audio_recorder import AudioBuffer
+from src.engines._wav import SAMPLE_RATE, SAMPLE_WIDTH
+
+if TYPE_CHECKING:
+    import speech_recognition as sr
+
+logger = logging.getLogger(__name__)
 
 
 class SpeechRecognitionEngine(ISpeechEngine):
     """Real speech recognition using Google Speech Recognition"""
 
     def __init__(self, engine_type: str = "google"):
+        import speech_recognition as sr
+
         self.engine_type = engine_type
         self.recognizer = sr.Recognizer()
 
@@ -19,15 +25,15 @@ class SpeechRecognitionEngine(ISpeechEngine):
         self.recognizer.pause_threshold = 0.8
         self.recognizer.phrase_threshold = 0.3
 
-        print(f"Speech recognition engine initialized: {engine_type}")
+        logger.debug("Speech recognition engine initialized: %s", engine_type)
 
-    def transcribe(self, audio_data: bytes) -> str:
+    def transcribe(self, audio_data: AudioBuffer) -> str:
         """Convert audio data to text using speech recognition"""
         try:
             if not audio_data:
                 return "No audio data received"
 
-            print(f"Processing {len(audio_data)} bytes of audio...")
+            logger.debug("Processing %d bytes of audio...", len(audio_data))
 
             # Convert raw audio bytes to AudioData format
             audio_file = self._bytes_to_audio_data(audio_data)
@@ -39,55 +45,46 @@ class SpeechRecognitionEngine(ISpeechEngine):
             text = self._recognize_audio(audio_file)
 
             if text:
-                print(f"Speech recognized: '{text}'")
+                logger.debug("Speech recognized: '%s'", text)
                 return text
             else:
                 return "Could not understand audio"
 
         except Exception as e:
-            print(f"Speech recognition error: {e}")
+            logger.error("Speech recognition error: %s", e)
             return f"Recognition error: {str(e)}"
 
     def is_available(self) -> bool:
         """Check if speech recognition is available"""
         try:
+            import speech_recognition as sr
+
             # Test if we can create a recognizer
             test_recognizer = sr.Recognizer()
             return True
         except Exception as e:
-            print(f"Speech recognition not available: {e}")
+            logger.warning("Speech recognition not available: %s", e)
             return False
 
-    def _bytes_to_audio_data(self, audio_bytes: bytes) -> Optional[sr.AudioData]:
+    def _bytes_to_audio_data(
+        self, audio_bytes: AudioBuffer
+    ) -> Optional["sr.AudioData"]:
         """Convert raw audio bytes to SpeechRecognition AudioData format"""
+        import speech_recognition as sr
+
         try:
-            # Create a WAV file in memory from raw audio bytes
-            # Assume 16kHz, 16-bit, mono (matching our recorder settings)
-            sample_rate = 16000
-            sample_width = 2  # 16-bit = 2 bytes
-
-            # Create WAV file in memory
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, "wb") as wav_file:
-                wav_file.setnchannels(1)  # Mono
-                wav_file.setsampwidth(sample_width)
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(audio_bytes)
-
-            # Reset buffer position
-            wav_buffer.seek(0)
-
-            # Convert to AudioData
-            with sr.AudioFile(wav_buffer) as source:
-                audio_data = self.recognizer.record(source)
-                return audio_data
+            # Recorder output is already raw PCM, so wrap it directly rather
+            # than encoding a WAV and decoding it again (AudioData needs bytes)
+            return sr.AudioData(bytes(audio_bytes), SAMPLE_RATE, SAMPLE_WIDTH)
 
         except Exception as e:
-            print(f"Audio conversion error: {e}")
+            logger.error("Audio conversion error: %s", e)
             return None
 
-    def _recognize_audio(self, audio_data: sr.AudioData) -> Optional[str]:
+    def _recognize_audio(self, audio_data: "sr.AudioData") -> Optional[str]:
         """Recognize speech from AudioData using configured engine"""
+        import speech_recognition as sr
+
         try:
             if self.engine_type == "google":
                 # Use Google Speech Recognition (free tier)
@@ -105,46 +102,53 @@ class SpeechRecognitionEngine(ISpeechEngine):
                 return text
 
             else:
-                print(f"Unknown engine type: {self.engine_type}")
+                logger.warning("Unknown engine type: %s", self.engine_type)
                 return None
 
         except sr.UnknownValueError:
-            print("Speech was unclear or not detected")
+            logger.debug("Speech was unclear or not detected")
             return "Speech not clear"
         except sr.RequestError as e:
-            print(f"Speech service error: {e}")
+            logger.error("Speech service error: %s", e)
             return f"Service error: {e}"
         except Exception as e:
-            print(f"Recognition error: {e}")
+            logger.error("Recognition error: %s", e)
             return f"Error: {e}"
 
     def set_engine(self, engine_type: str) -> None:
         """Change the speech recognition engine"""
         self.engine_type = engine_type
-        print(f"Speech engine changed to: {engine_type}")
+        logger.debug("Speech engine changed to: %s", engine_type)
 
     def adjust_for_ambient_noise(self, duration: float = 1.0) -> None:
         """Adjust recognizer sensitivity based on ambient noise"""
         try:
-            print(f"🔧 Adjusting for ambient noise ({duration}s)...")
+            logger.debug("🔧 Adjusting for ambient noise (%ss)...", duration)
             # This would typically be done with microphone input
             # For now, just adjust energy threshold
             self.recognizer.energy_threshold = 300
             self.recognizer.dynamic_energy_threshold = True
-            print("Ambient noise adjustment completed")
+            logger.debug("Ambient noise adjustment completed")
         except Exception as e:
-            print(f"Ambient noise adjustment failed: {e}")
+            logger.error("Ambient noise adjustment failed: %s", e)
 
 
 class OfflineSpeechEngine(ISpeechEngine):
     """Offline speech recognition using built-in engines"""
 
+    # Result of the (slow) Sphinx probe, shared by all instances
+    _sphinx_available: Optional[bool] = None
+
     def __init__(self):
+        import speech_recognition as sr
+
         self.recognizer = sr.Recognizer()
-        print("Offline speech recognition engine initialized")
+        logger.debug("Offline speech recognition engine initialized")
 
-    def transcribe(self, audio_data: bytes) -> str:
+    def transcribe(self, audio_data: AudioBuffer) -> str:
         """Convert audio using offline recognition"""
+        import speech_recognition as sr
+
         try:
             if not audio_data:
                 return "No audio data received"
@@ -159,7 +163,7 @@ class OfflineSpeechEngine(ISpeechEngine):
             try:
                 text = self.recognizer.recognize_sphinx(audio_file)
                 if text:
-                    print(f"Offline speech recognized: '{text}'")
+                    logger.debug("Offline speech recognized: '%s'", text)
                     return text
                 else:
                     return "Could not understand audio"
@@ -169,43 +173,40 @@ class OfflineSpeechEngine(ISpeechEngine):
                 return f"Offline recognition error: {e}"
 
         except Exception as e:
-            print(f"Offline speech recognition error: {e}")
+            logger.error("Offline speech recognition error: %s", e)
             return f"Recognition error: {str(e)}"
 
     def is_available(self) -> bool:
         """Check if offline recognition is available"""
+        cls = type(self)
+        if cls._sphinx_available is not None:
+            return cls._sphinx_available
+
         try:
+            import speech_recognition as sr
+
             # Test if Sphinx is available
             test_recognizer = sr.Recognizer()
             # This will fail if pocketsphinx is not installed
             test_audio = sr.AudioData(b"\x00" * 1000, 16000, 2)
             test_recognizer.recognize_sphinx(test_audio)
-            return True
+            cls._sphinx_available = True
         except:
-            print(
+            logger.warning(
                 "Offline speech recognition not available (pocketsphinx not installed)"
             )
-            return False
+            cls._sphinx_available = False
+        return cls._sphinx_available
 
-    def _bytes_to_audio_data(self, audio_bytes: bytes) -> Optional[sr.AudioData]:
+    def _bytes_to_audio_data(
+        self, audio_bytes: AudioBuffer
+    ) -> Optional["sr.AudioData"]:
         """Convert raw audio bytes to AudioData format"""
-        try:
-            sample_rate = 16000
-            sample_width = 2
-
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, "wb") as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(sample_width)
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(audio_bytes)
+        import speech_recognition as sr
 
-            wav_buffer.seek(0)
-
-            with sr.AudioFile(wav_buffer) as source:
-                audio_data = self.recognizer.record(source)
-                return audio_data
+        try:
+            return sr.AudioData(bytes(audio_bytes), SAMPLE_RATE, SAMPLE_WIDTH)
 
         except Exception as e:
-            print(f"Offline audio conversion error: {e}")
+            logger.error("Offline audio conversion error: %s", e)
             return None
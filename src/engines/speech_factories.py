@@ -1,81 +1,176 @@
-from typing import Dict, Any
+import importlib.util
+from types import MappingProxyType
+from typing import Any, Hashable, Mapping, Optional
 from src.interfaces.speech_factory import ISpeechEngineFactory
 from src.interfaces.speech import ISpeechEngine
 from src.interfaces.settings import ISettingsManager
-from src.engines.openai_speech import OpenAISpeechEngine
-from src.engines.groq_speech import GroqSpeechEngine
-from src.engines.local_whisper_speech import LocalWhisperEngine
+from src.engines._api_key_cache import ApiKeyCache
+
+# Engine modules are imported inside create_engine() so each provider's SDK
+# is only loaded when that engine is actually built
+
+# Engine info is static, so each factory hands out the same read-only mapping
+# rather than building a new dict on every poll; callers copy before mutating
+_OPENAI_INFO: Mapping[str, Any] = MappingProxyType(
+    {
+        "name": "OpenAI Speech",
+        "id": "openai",
+        "provider": "OpenAI",
+        "requires_api_key": True,
+        "model": "whisper-1",
+    }
+)
+
+_GROQ_INFO: Mapping[str, Any] = MappingProxyType(
+    {
+        "name": "Groq Speech",
+        "id": "groq",
+        "provider": "Groq",
+        "requires_api_key": True,
+        "model": "whisper-large-v3",
+    }
+)
+
+_LOCAL_WHISPER_INFO: Mapping[str, Any] = MappingProxyType(
+    {
+        "name": "Local Whisper",
+        "id": "local_whisper",
+        "provider": "Local",
+        "requires_api_key": False,
+        "model_sizes": ("tiny", "base", "small", "medium", "large"),
+        "compute_types": ("auto", "int8", "int8_float16", "float16", "float32"),
+    }
+)
+
+_ONNX_WHISPER_INFO: Mapping[str, Any] = MappingProxyType(
+    {
+        "name": "Local Whisper (ONNX)",
+        "id": "onnx_whisper",
+        "provider": "Local",
+        "requires_api_key": False,
+        "compute_types": ("int8",),
+    }
+)
 
 
 class OpenAISpeechFactory(ISpeechEngineFactory):
     """Factory for creating OpenAI speech engines"""
 
+    def __init__(self):
+        self._api_key_cache = ApiKeyCache("openai")
+
     def create_engine(self, settings: ISettingsManager) -> ISpeechEngine:
         """Create OpenAI speech engine instance"""
+        from src.engines.openai_speech import OpenAISpeechEngine
+
         return OpenAISpeechEngine(settings)
 
-    def get_engine_info(self) -> Dict[str, Any]:
+    def get_engine_info(self) -> Mapping[str, Any]:
         """Get information about OpenAI speech"""
-        return {
-            "name": "OpenAI Speech",
-            "id": "openai",
-            "provider": "OpenAI",
-            "requires_api_key": True,
-            "model": "whisper-1",
-        }
+        return _OPENAI_INFO
 
     def is_available(self, settings: ISettingsManager) -> bool:
         """Check if OpenAI speech is available"""
         try:
-            api_key = settings.get_provider_api_key("openai")
-            return bool(api_key and api_key.strip())
+            return bool(self._api_key_cache.get(settings))
         except Exception:
             return False
 
+    def get_settings_key(self, settings: ISettingsManager) -> Hashable:
+        """OpenAI engines only depend on the OpenAI API key"""
+        return self._api_key_cache.get(settings)
+
 
 class GroqSpeechFactory(ISpeechEngineFactory):
     """Factory for creating Groq speech engines"""
 
+    def __init__(self):
+        self._api_key_cache = ApiKeyCache("groq")
+
     def create_engine(self, settings: ISettingsManager) -> ISpeechEngine:
         """Create Groq speech engine instance"""
+        from src.engines.groq_speech import GroqSpeechEngine
+
         return GroqSpeechEngine(settings)
 
-    def get_engine_info(self) -> Dict[str, Any]:
+    def get_engine_info(self) -> Mapping[str, Any]:
         """Get information about Groq speech"""
-        return {
-            "name": "Groq Speech",
-            "id": "groq",
-            "provider": "Groq",
-            "requires_api_key": True,
-            "model": "whisper-large-v3",
-        }
+        return _GROQ_INFO
 
     def is_available(self, settings: ISettingsManager) -> bool:
         """Check if Groq speech is available"""
         try:
-            api_key = settings.get_provider_api_key("groq")
-            return bool(api_key and api_key.strip())
+            return bool(self._api_key_cache.get(settings))
         except Exception:
             return False
 
+    def get_settings_key(self, settings: ISettingsManager) -> Hashable:
+        """Groq engines only depend on the Groq API key"""
+        return self._api_key_cache.get(settings)
+
 
 class LocalWhisperFactory(ISpeechEngineFactory):
     """Factory for creating Local Whisper engines"""
 
+    # Whether faster-whisper is importable; resolved on first probe
+    _installed: Optional[bool] = None
+
     def create_engine(self, settings: ISettingsManager) -> ISpeechEngine:
         """Create Local Whisper engine instance"""
+        from src.engines.local_whisper_speech import LocalWhisperEngine
+
         return LocalWhisperEngine(settings)
 
-    def get_engine_info(self) -> Dict[str, Any]:
+    def get_settings_key(self, settings: ISettingsManager) -> Hashable:
+        """Local Whisper engines only depend on the local Whisper options"""
+        return tuple(settings.get_local_whisper_settings().items())
+
+    def get_engine_info(self) -> Mapping[str, Any]:
         """Get information about Local Whisper"""
-        return {
-            "name": "Local Whisper",
-            "id": "local_whisper",
-            "provider": "Local",
-            "requires_api_key": False,
-            "model_sizes": ["tiny", "base", "small", "medium", "large"],
-        }
+        return _LOCAL_WHISPER_INFO
+
+    def is_available(self, settings: ISettingsManager) -> bool:
+        """Local Whisper is available if faster-whisper is installed"""
+        if LocalWhisperFactory._installed is None:
+            LocalWhisperFactory._installed = (
+                importlib.util.find_spec("faster_whisper") is not None
+            )
+        return LocalWhisperFactory._installed
+
+
+class OnnxWhisperFactory(ISpeechEngineFactory):
+    """Factory for creating ONNX Runtime (sherpa-onnx) Whisper engines"""
+
+    # Whether sherpa-onnx is importable; resolved on first probe
+    _installed: Optional[bool] = None
+
+    def create_engine(self, settings: ISettingsManager) -> ISpeechEngine:
+        """Create ONNX Whisper engine instance"""
+        from src.engines.onnx_whisper_speech import OnnxWhisperEngine
+
+        return OnnxWhisperEngine(settings)
+
+    def get_settings_key(self, settings: ISettingsManager) -> Hashable:
+        """ONNX Whisper engines only depend on the local Whisper options"""
+        return tuple(settings.get_local_whisper_settings().items())
+
+    def get_engine_info(self) -> Mapping[str, Any]:
+        """Get information about ONNX Whisper"""
+        return _ONNX_WHISPER_INFO
 
     def is_available(self, settings: ISettingsManager) -> bool:
-        """Local Whisper is available if we can import it (which we already did)"""
-        return True
+        """ONNX Whisper is available if sherpa-onnx and a model are installed"""
+        if OnnxWhisperFactory._installed is None:
+            OnnxWhisperFactory._installed = (
+                importlib.util.find_spec("sherpa_onnx") is not None
+            )
+        if not OnnxWhisperFactory._installed:
+            return False
+
+        try:
+            from src.engines.onnx_whisper_speech import find_model_files
+
+            options = settings.get_local_whisper_settings()
+            return find_model_files(options.get("onnx_model_dir")) is not None
+        except Exception:
+            return False
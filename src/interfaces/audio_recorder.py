@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Union
+
+# Raw 16-bit mono PCM. Recorders may hand out a read-only view over their own
+# buffer instead of a bytes copy, so consumers must never mutate it
+AudioBuffer = Union[bytes, bytearray, memoryview]
 
 
 class IAudioRecorder(ABC):
@@ -11,7 +15,7 @@ class IAudioRecorder(ABC):
         pass
 
     @abstractmethod
-    def stop_recording(self) -> Optional[bytes]:
+    def stop_recording(self) -> Optional[AudioBuffer]:
         """Stop recording and return audio data"""
         pass
 
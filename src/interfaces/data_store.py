@@ -1,11 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
+from src.interfaces.audio_recorder import AudioBuffer
 
 
 @dataclass
 class TranscriptEntry:
+    # Explicit slots (no per-instance __dict__); dataclass(slots=True) needs 3.10+
+    __slots__ = (
+        "id",
+        "original_text",
+        "processed_text",
+        "timestamp",
+        "duration",
+        "inserted_successfully",
+        "audio_file_path",
+        "provider_used",
+    )
+
     id: int
     original_text: str
     processed_text: Optional[str]
@@ -52,11 +65,45 @@ class IDataStore(ABC):
         pass
 
     @abstractmethod
-    def save_audio_file(self, audio_data: bytes, transcript_id: int) -> Optional[str]:
-        """Save audio data to file and return the file path"""
+    def save_audio_file(
+        self, audio_data: AudioBuffer, transcript_id: int
+    ) -> Optional[str]:
+        """Save audio data to a WAV file and return the file path
+
+        audio_data may be a view over the recorder's buffer; it is written
+        without copying and must not be mutated.
+        """
         pass
 
     @abstractmethod
     def update_audio_path(self, transcript_id: int, audio_file_path: str) -> bool:
         """Update the audio file path for a transcript"""
         pass
+
+    def save_transcript_with_audio(
+        self,
+        original_text: str,
+        processed_text: str,
+        duration: float,
+        audio_data: AudioBuffer,
+        provider_used: str = "unknown",
+    ) -> Tuple[int, Optional[str]]:
+        """Save a transcript together with its audio file. Returns (ID, audio path)
+
+        Implementations should override this to do it in a single transaction.
+        """
+        transcript_id = self.save_transcript(
+            original_text=original_text,
+            processed_text=processed_text,
+            duration=duration,
+            audio_file_path=None,
+            provider_used=provider_used,
+        )
+
+        audio_file_path = self.save_audio_file(audio_data, transcript_id)
+        if audio_file_path and not self.update_audio_path(
+            transcript_id, audio_file_path
+        ):
+            audio_file_path = None
+
+        return transcript_id, audio_file_path
@@ -35,6 +35,31 @@ class ISettingsManager(ABC):
         """Set custom instructions"""
         pass
 
+    @abstractmethod
+    def get_emit_thoughts(self) -> bool:
+        """Get whether the LLM should also return its reasoning"""
+        pass
+
+    @abstractmethod
+    def set_emit_thoughts(self, enabled: bool) -> None:
+        """Set whether the LLM should also return its reasoning"""
+        pass
+
+    @abstractmethod
+    def get_local_whisper_settings(self) -> dict:
+        """Get local Whisper model options (device, compute_type, ...)"""
+        pass
+
+    @abstractmethod
+    def set_local_whisper_setting(self, name: str, value) -> None:
+        """Set a single local Whisper model option"""
+        pass
+
+    @abstractmethod
+    def get_settings_version(self) -> int:
+        """Get a counter that increases whenever any setting changes"""
+        pass
+
     @abstractmethod
     def get_all(self) -> dict:
         """Get all settings as a dictionary"""
@@ -1,12 +1,13 @@
 from abc import ABC, abstractmethod
+from src.interfaces.audio_recorder import AudioBuffer
 
 
 class ISpeechEngine(ABC):
     """Abstract interface for speech-to-text engines"""
 
     @abstractmethod
-    def transcribe(self, audio_data: bytes) -> str:
-        """Convert audio data to text"""
+    def transcribe(self, audio_data: AudioBuffer) -> str:
+        """Convert audio data to text (without mutating audio_data)"""
         pass
 
     @abstractmethod
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, List, Dict, Any
+from typing import Callable, List, Dict, Any, Hashable, Mapping
 from src.interfaces.speech import ISpeechEngine
 from src.interfaces.settings import ISettingsManager
 
@@ -13,15 +13,23 @@ class ISpeechEngineFactory(ABC):
         pass
 
     @abstractmethod
-    def get_engine_info(self) -> Dict[str, Any]:
-        """Get information about this engine type"""
+    def get_engine_info(self) -> Mapping[str, Any]:
+        """Get read-only information about this engine type"""
         pass
 
     @abstractmethod
     def is_available(self, settings: ISettingsManager) -> bool:
-        """Check if this engine is available with current settings"""
+        """Check if this engine is available with current settings (never raises)"""
         pass
 
+    def get_settings_key(self, settings: ISettingsManager) -> Hashable:
+        """Get a key of the settings a built engine depends on
+
+        A built engine is reused until this key changes. The default is the
+        global settings version, so any setting change rebuilds the engine.
+        """
+        return settings.get_settings_version()
+
 
 class ISpeechEngineRegistry(ABC):
     """Abstract interface for speech engine registry"""
@@ -1,23 +1,34 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any
+from src.interfaces.audio_recorder import AudioBuffer
 
 
 class ISpeechEngineRouter(ABC):
     """Interface for speech engine routing and fallback management"""
 
     @abstractmethod
-    def transcribe_with_fallback(self, audio_data: bytes) -> str:
+    def transcribe_with_fallback(self, audio_data: AudioBuffer) -> str:
         """
         Transcribe audio using the best available engine with automatic fallback.
 
         Args:
-            audio_data: Raw audio bytes to transcribe
+            audio_data: Raw audio buffer to transcribe (not mutated)
 
         Returns:
             Transcribed text string
         """
         pass
 
+    @abstractmethod
+    def warm_up(self) -> None:
+        """
+        Build the engine for the selected provider ahead of first use.
+
+        Raises:
+            Exception: If the selected provider's engine cannot be created
+        """
+        pass
+
     @abstractmethod
     def get_last_used_engine_info(self) -> Dict[str, Any]:
         """
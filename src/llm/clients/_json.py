@@ -0,0 +1,114 @@
+from typing import Iterator, List, Optional
+
+# orjson parses replies several times faster than the stdlib, but it is an
+# optional dependency; its JSONDecodeError subclasses the stdlib one
+try:
+    from orjson import JSONDecodeError, loads as json_loads
+except ImportError:
+    from json import JSONDecodeError, loads as json_loads
+
+
+def strip_code_fence(text: str) -> str:
+    """Strip whitespace and a ```json ... ``` fence wrapped around a reply"""
+    text = text.strip()
+    # Replies are normally bare JSON, so this is one check in the common case
+    if text.startswith("```"):
+        text = text[3:]
+        if text.startswith("json"):
+            text = text[4:]
+        if text.endswith("```"):
+            text = text[:-3]
+        text = text.strip()
+    return text
+
+
+class OutputFieldScanner:
+    """Incrementally scans a streamed JSON reply for the end of its "output" value
+
+    feed() each chunk as it arrives; once the top-level "output" string has
+    closed it returns the offset just past its closing quote, so the caller
+    can stop reading and parse `reply[:offset] + "}"`.
+    """
+
+    __slots__ = (
+        "_offset",
+        "_depth",
+        "_in_string",
+        "_escape",
+        "_after_colon",
+        "_key",
+        "_key_chars",
+    )
+
+    def __init__(self):
+        self._offset = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._after_colon = False
+        self._key: Optional[str] = None
+        self._key_chars: Optional[List[str]] = None
+
+    def feed(self, chunk: str) -> int:
+        """Scan the next chunk; return the end offset of "output", or -1"""
+        for i, char in enumerate(chunk):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key_chars is not None:
+                        # End of a top-level key
+                        self._key = "".join(self._key_chars)
+                        self._key_chars = None
+                    elif self._depth == 1 and self._key == "output":
+                        return self._offset + i + 1
+                    continue
+                if self._key_chars is not None:
+                    self._key_chars.append(char)
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1 and not self._after_colon:
+                    self._key_chars = []
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+            elif self._depth == 1:
+                if char == ":":
+                    self._after_colon = True
+                elif char == ",":
+                    self._after_colon = False
+                    self._key = None
+
+        self._offset += len(chunk)
+        return -1
+
+
+def read_reply(chunks: Iterator[str]) -> str:
+    """Collect a streamed JSON reply, stopping as soon as "output" is complete
+
+    Closing `chunks` early ends the HTTP stream, so the server stops sending
+    tokens (usually trailing fields) that would never be read.
+    """
+    scanner = OutputFieldScanner()
+    parts = []
+    consumed = 0
+    try:
+        for chunk in chunks:
+            end = scanner.feed(chunk)
+            if end >= 0:
+                # Cut this chunk right after the "output" value and close the
+                # object, so the reply is joined exactly once
+                parts.append(chunk[: end - consumed])
+                parts.append("}")
+                return "".join(parts)
+            parts.append(chunk)
+            consumed += len(chunk)
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+    return "".join(parts)
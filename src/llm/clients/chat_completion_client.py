@@ -0,0 +1,258 @@
+import logging
+from abc import abstractmethod
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Mapping, Optional, Tuple
+from src.llm.interfaces.llm_client import ILLMClient
+from src.interfaces.settings import ISettingsManager
+from src.services.http_pool import get_http_client
+from src.engines._api_key_cache import ApiKeyCache
+from src.llm.clients._json import (
+    JSONDecodeError,
+    json_loads,
+    read_reply,
+    strip_code_fence,
+)
+
+logger = logging.getLogger(__name__)
+
+# Prefix the prompt's examples use to mark the transcription to rewrite
+_INPUT_PREFIX = "Transcription input: "
+
+# Appended to the system prompt; the client parses the reply, so it decides
+# the reply format. Plain text skips decoding "thoughts" the app never shows.
+_TEXT_OUTPUT_FORMAT = """
+
+## Output Format
+
+Respond with ONLY the final, cleaned text with no additional commentary, \
+explanations, or metadata. Do NOT prepend output with any indicators such as \
+"Output:"."""
+
+_JSON_OUTPUT_FORMAT = """
+
+## Output Format
+
+You MUST respond with valid JSON containing exactly two fields:
+
+```json
+{
+  "thoughts": <Brief reasoning about what processing was needed for this \
+transcription / best way to process this transcription>,
+  "output": <ONLY the final, cleaned text with no additional commentary, \
+explanations, or metadata. Do NOT prepend output with any indicators such as \
+"Output:".>
+}
+```"""
+
+
+class ChatCompletionLLMClient(ILLMClient):
+    """Base for LLM clients on an OpenAI-style chat completions SDK
+
+    Subclasses name the provider and model and build the SDK client.
+    """
+
+    provider = ""  # Settings key of the provider's API key
+    provider_name = ""  # Display name used in info and error messages
+    default_model = ""
+    # Routes requests sharing the system prompt to the same prompt cache,
+    # for providers that accept OpenAI's prompt_cache_key
+    prompt_cache_key: Optional[str] = None
+    # Whether the provider streams replies in JSON mode; JSON replies from
+    # providers that don't are requested in one non-streaming call
+    supports_json_stream = True
+
+    def __init__(self, settings_manager: ISettingsManager):
+        self.settings_manager = settings_manager
+        self.model = self.default_model
+        # Seconds to wait for the next bytes of a reply. The reply streams in
+        # token by token, so this bounds a stalled provider, not a long reply;
+        # on failure the processor falls back to the raw transcription.
+        self.timeout = 10
+        self.max_retries = 1
+
+        # Request options that never change between calls, built once for
+        # plain-text replies and for JSON replies carrying the model's thoughts
+        self._text_request_options = {
+            "model": self.model,
+            "max_tokens": 2048,
+            "temperature": 0,  # Low temperature for consistent text processing
+            "stream": True,
+        }
+        if self.prompt_cache_key:
+            # Sent via extra_body so older SDK versions pass it through as is
+            self._text_request_options["extra_body"] = {
+                "prompt_cache_key": self.prompt_cache_key
+            }
+        self._json_request_options = {
+            **self._text_request_options,
+            "response_format": {"type": "json_object"},
+            "stream": self.supports_json_stream,
+        }
+
+        # System message for the last (prompt, emit_thoughts) seen; the prompt
+        # rarely changes, so requests share it and only build the user message
+        self._system_message: Tuple[Tuple[str, bool], Dict[str, str]] = (
+            ("", False),
+            {"role": "system", "content": ""},
+        )
+
+        # Model info only varies with availability, so both variants are
+        # built once and handed out read-only
+        self._model_info = {
+            available: MappingProxyType(
+                {
+                    "provider": self.provider_name,
+                    "model": self.model,
+                    "available": available,
+                }
+            )
+            for available in (True, False)
+        }
+
+        # API key re-read from settings only after they change
+        self._api_key_cache = ApiKeyCache(self.provider)
+
+        # SDK client, rebuilt only when the API key changes
+        self._client = None
+        self._client_api_key = None
+
+    def generate(self, system_prompt: str, user_input: str) -> str:
+        """Generate response using the provider's API"""
+        emit_thoughts = self.settings_manager.get_emit_thoughts()
+        chunks = self.generate_stream(system_prompt, user_input, emit_thoughts)
+        if not emit_thoughts:
+            # Plain-text reply is the output itself; the router strips it
+            return "".join(chunks)
+
+        if self.supports_json_stream:
+            # Only "output" is needed, so stop reading once it has streamed in
+            json_content = read_reply(chunks)
+        else:
+            # The whole reply arrives as one chunk
+            json_content = "".join(chunks)
+        json_content = strip_code_fence(json_content)
+
+        try:
+            # Parse the JSON response
+            parsed_response = json_loads(json_content)
+
+            # Log thoughts for debugging/monitoring
+            if "thoughts" in parsed_response:
+                logger.debug("Thoughts: %s", parsed_response["thoughts"])
+
+            # Extract the output field
+            if "output" in parsed_response:
+                output_text = parsed_response["output"]
+                logger.debug("Output: %s", output_text)
+                return output_text
+            else:
+                logger.warning(
+                    "No 'output' field in JSON response, returning original input"
+                )
+                return user_input
+
+        except JSONDecodeError as e:
+            logger.error("Failed to parse JSON response: %s", e)
+            logger.debug("Raw response: %.200s", json_content)
+            # Return original input as fallback
+            return user_input
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_input: str,
+        emit_thoughts: Optional[bool] = None,
+    ) -> Iterator[str]:
+        """Stream the raw response text as tokens arrive
+
+        The reply is JSON with "thoughts" and "output" when emit_thoughts is
+        set, plain text otherwise; None follows the emit_thoughts setting.
+        JSON replies from providers without JSON-mode streaming are yielded
+        as a single chunk.
+        """
+        if emit_thoughts is None:
+            emit_thoughts = self.settings_manager.get_emit_thoughts()
+
+        api_key = self._api_key_cache.get(self.settings_manager)
+        if not api_key:
+            raise Exception(
+                f"{self.provider_name} client not available - no API key provided"
+            )
+
+        try:
+            client = self._get_client(api_key)
+
+            logger.debug(
+                "%s LLM: Processing text with %s", self.provider_name, self.model
+            )
+            logger.debug("Input: %.100s", user_input)
+
+            key = (system_prompt, emit_thoughts)
+            cached_key, system_message = self._system_message
+            if cached_key != key:
+                output_format = (
+                    _JSON_OUTPUT_FORMAT if emit_thoughts else _TEXT_OUTPUT_FORMAT
+                )
+                system_message = {
+                    "role": "system",
+                    "content": system_prompt + output_format,
+                }
+                self._system_message = (key, system_message)
+
+            if emit_thoughts:
+                request_options = self._json_request_options
+            else:
+                request_options = self._text_request_options
+
+            response = client.chat.completions.create(
+                messages=[
+                    system_message,
+                    {"role": "user", "content": _INPUT_PREFIX + user_input},
+                ],
+                **request_options,
+            )
+
+            if not request_options["stream"]:
+                content = response.choices[0].message.content
+                if content:
+                    yield content
+                return
+
+            try:
+                for chunk in response:
+                    # Keep-alive and final usage chunks carry no content
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                # Also runs when the consumer stops early; drops the response
+                response.close()
+
+        except Exception as e:
+            logger.error("%s LLM generation failed: %s", self.provider_name, e)
+            raise Exception(f"{self.provider_name} API request failed: {e}") from e
+
+    def _get_client(self, api_key: str):
+        """Get the SDK client, reusing it while the API key is unchanged"""
+        if self._client is None or api_key != self._client_api_key:
+            # Shared keep-alive pool avoids a TCP + TLS handshake per request
+            self._client = self._create_sdk_client(
+                api_key=api_key,
+                http_client=get_http_client(),
+                timeout=self.timeout,
+                max_retries=self.max_retries,
+            )
+            self._client_api_key = api_key
+        return self._client
+
+    @abstractmethod
+    def _create_sdk_client(self, **options: Any):
+        """Build the provider's SDK client from the given constructor options"""
+        pass
+
+    def is_available(self) -> bool:
+        """Check if the provider's API key is configured"""
+        return bool(self._api_key_cache.get(self.settings_manager))
+
+    def get_model_info(self) -> Mapping[str, Any]:
+        """Get information about the model"""
+        return self._model_info[self.is_available()]
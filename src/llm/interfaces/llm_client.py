@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, Mapping
 
 
 class ILLMClient(ABC):
@@ -32,11 +33,11 @@ class ILLMClient(ABC):
         pass
 
     @abstractmethod
-    def get_model_info(self) -> dict:
+    def get_model_info(self) -> Mapping[str, Any]:
         """
         Get information about the LLM model being used
 
         Returns:
-            Dictionary with model information
+            Read-only mapping with model information
         """
         pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Any, Mapping
+from src.llm.interfaces.llm_client import ILLMClient
 
 
 class ILLMRouter(ABC):
@@ -15,17 +16,33 @@ class ILLMRouter(ABC):
             user_input: The user text to process
 
         Returns:
-            Processed text string
+            Processed text string, stripped of surrounding whitespace
         """
         pass
 
     @abstractmethod
-    def get_last_used_llm_info(self) -> Dict[str, Any]:
+    def get_llm_client(self, provider: str) -> ILLMClient:
+        """
+        Get the LLM client for a provider, created once and then reused.
+
+        Args:
+            provider: Provider name (e.g., 'openai', 'local')
+
+        Returns:
+            The provider's LLM client
+
+        Raises:
+            Exception: If the provider is unknown
+        """
+        pass
+
+    @abstractmethod
+    def get_last_used_llm_info(self) -> Mapping[str, Any]:
         """
         Get information about the LLM that was used in the last processing call.
 
         Returns:
-            Dictionary with LLM information (provider, model, success, etc.)
+            Read-only mapping with LLM information (provider, model, success, etc.)
         """
         pass
 
@@ -1,10 +1,35 @@
-from typing import Dict, Any
+import logging
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping, Tuple
 from src.llm.interfaces.llm_router import ILLMRouter
 from src.llm.interfaces.llm_client import ILLMClient
 from src.llm.clients.openai_client import OpenAILLMClient
 from src.llm.clients.groq_client import GroqLLMClient
 from src.llm.clients.passthrough_client import PassthroughLLMClient
 from src.interfaces.settings import ISettingsManager
+from src.engines._api_key_cache import ApiKeyCache
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failures after which a provider is skipped for a cooldown, so a
+# provider that is down fails fast instead of timing out on every dictation
+_CIRCUIT_FAILURES = 3
+_CIRCUIT_COOLDOWN = 30.0  # seconds
+
+# Fixed last-used LLM info, shared read-only instead of rebuilt per request
+_NO_LLM_INFO: Mapping[str, Any] = MappingProxyType(
+    {"provider": "None", "model": "None", "success": False, "error": None}
+)
+_NO_INPUT_INFO: Mapping[str, Any] = MappingProxyType(
+    {
+        "provider": "None",
+        "model": "None",
+        "success": False,
+        "error": "No input text provided",
+    }
+)
 
 
 class LLMRouter(ILLMRouter):
@@ -13,94 +38,198 @@ class LLMRouter(ILLMRouter):
     Maintains dependency inversion by depending only on abstractions.
     """
 
+    # Client constructor for each provider, called with the settings manager
+    _FACTORIES: Dict[str, Callable[[ISettingsManager], ILLMClient]] = {
+        "openai": OpenAILLMClient,
+        "groq": GroqLLMClient,
+        "local": lambda settings_manager: PassthroughLLMClient(),
+    }
+
     def __init__(self, settings_manager: ISettingsManager):
         self.settings_manager = settings_manager
 
-        # Track last used LLM for reporting
-        self._last_llm_info = {
-            "provider": "None",
-            "model": "None",
-            "success": False,
-            "error": None,
-        }
+        # One client per provider, shared by availability checks and requests;
+        # clients read settings live, so they stay valid when keys change
+        self._clients: Dict[str, ILLMClient] = {}
+
+        # Circuit breaker state per provider; reset when that provider's
+        # (API key, model) changes, so a corrected key is tried straight away
+        self._failures: Dict[str, int] = {}
+        self._paused_until: Dict[str, float] = {}
+        self._circuit_keys: Dict[str, Tuple[str, Any]] = {}
+        self._api_key_caches: Dict[str, ApiKeyCache] = {}
+        self._circuit_lock = threading.Lock()
+
+        # Track last used LLM for reporting, as a read-only mapping so it can
+        # be handed out without copying
+        self._last_llm_info: Mapping[str, Any] = _NO_LLM_INFO
+
+        # Success info per provider with the model info it was built from;
+        # clients return the same model info object until availability changes
+        self._success_info: Dict[str, Tuple[Mapping[str, Any], Mapping[str, Any]]] = {}
 
     def process_with_best_llm(self, system_prompt: str, user_input: str) -> str:
         """Process text using selected provider only (no fallbacks)"""
-        if not user_input or not user_input.strip():
-            self._last_llm_info = {
-                "provider": "None",
-                "model": "None",
-                "success": False,
-                "error": "No input text provided",
-            }
+        # isspace() stops at the first non-space character and copies nothing
+        if not user_input or user_input.isspace():
+            self._last_llm_info = _NO_INPUT_INFO
             return user_input
 
         # Get selected provider
         selected_provider = self.settings_manager.get_selected_provider()
 
         try:
-            # Create LLM client for selected provider
-            llm_client = self._create_llm_for_provider(selected_provider)
-
-            if not llm_client:
-                raise Exception(
-                    f"No LLM client available for provider: {selected_provider}"
-                )
-
-            # Check if client is available
-            if not llm_client.is_available():
-                if selected_provider == "local":
-                    # Local provider should always be available (passthrough)
-                    pass
-                else:
-                    raise Exception(
-                        f"{selected_provider} provider not available - check API key"
-                    )
-
-            print(f"Using {selected_provider} LLM provider")
+            llm_client = self._get_llm_for_provider(selected_provider)
 
             # Process with selected provider
-            result = llm_client.generate(system_prompt, user_input)
+            result = self._generate(
+                selected_provider, llm_client, system_prompt, user_input
+            )
 
-            # Record successful LLM use
-            model_info = llm_client.get_model_info()
-            self._last_llm_info = {
-                "provider": model_info.get("provider", selected_provider),
-                "model": model_info.get("model", "unknown"),
-                "success": True,
-                "error": None,
-            }
+            self._record_success(selected_provider, llm_client)
 
+            # The one place LLM output is stripped; callers rely on it
             return result.strip() if result else user_input
 
         except Exception as e:
-            print(f"LLM processing failed with {selected_provider} provider: {e}")
+            logger.error(
+                "LLM processing failed with %s provider: %s", selected_provider, e
+            )
 
             # Record failure
-            self._last_llm_info = {
-                "provider": selected_provider,
-                "model": "unknown",
-                "success": False,
-                "error": str(e),
-            }
+            self._record_error(selected_provider, str(e))
 
             # No fallback - raise exception to inform user
             raise Exception(f"LLM processing failed: {e}")
 
+    def _get_llm_for_provider(self, provider: str) -> ILLMClient:
+        """Get the LLM client for the selected provider, checking it can be used"""
+        # Reuse (or create) the LLM client for the selected provider
+        llm_client = self.get_llm_client(provider)
+
+        if not llm_client:
+            raise Exception(f"No LLM client available for provider: {provider}")
+
+        # Check if client is available
+        if not llm_client.is_available():
+            if provider == "local":
+                # Local provider should always be available (passthrough)
+                pass
+            else:
+                raise Exception(f"{provider} provider not available - check API key")
+
+        self._check_circuit(provider, llm_client)
+
+        logger.debug("Using %s LLM provider", provider)
+        return llm_client
+
+    def _generate(
+        self,
+        provider: str,
+        llm_client: ILLMClient,
+        system_prompt: str,
+        user_input: str,
+    ) -> str:
+        """Call the client, tracking consecutive failures for the circuit"""
+        try:
+            result = llm_client.generate(system_prompt, user_input)
+        except Exception:
+            self._record_failure(provider)
+            raise
+
+        with self._circuit_lock:
+            self._failures.pop(provider, None)
+        return result
+
+    def _check_circuit(self, provider: str, llm_client: ILLMClient) -> None:
+        """Raise if the provider is paused after repeated failures"""
+        api_key_cache = self._api_key_caches.get(provider)
+        if api_key_cache is None:
+            api_key_cache = self._api_key_caches.setdefault(
+                provider, ApiKeyCache(provider)
+            )
+        circuit_key = (
+            api_key_cache.get(self.settings_manager),
+            llm_client.get_model_info().get("model"),
+        )
+
+        with self._circuit_lock:
+            if self._circuit_keys.get(provider) != circuit_key:
+                self._failures.pop(provider, None)
+                self._paused_until.pop(provider, None)
+                self._circuit_keys[provider] = circuit_key
+
+            paused_until = self._paused_until.get(provider)
+
+        if paused_until is not None and time.monotonic() < paused_until:
+            raise Exception(f"{provider} provider paused after repeated failures")
+
+    def _record_failure(self, provider: str) -> None:
+        """Count a failed request, pausing the provider once it keeps failing"""
+        with self._circuit_lock:
+            failures = self._failures.get(provider, 0) + 1
+            self._failures[provider] = failures
+            if failures < _CIRCUIT_FAILURES:
+                return
+            # After the cooldown one request is let through; if it fails too,
+            # the count is still over the limit and the pause starts again
+            self._paused_until[provider] = time.monotonic() + _CIRCUIT_COOLDOWN
+
+        logger.warning(
+            "%s provider failed %d times in a row, pausing it for %.0f s",
+            provider,
+            failures,
+            _CIRCUIT_COOLDOWN,
+        )
+
+    def get_llm_client(self, provider: str) -> ILLMClient:
+        """Get the LLM client for the specified provider, creating it once"""
+        llm_client = self._clients.get(provider)
+        if llm_client is None:
+            llm_client = self._create_llm_for_provider(provider)
+            self._clients[provider] = llm_client
+        return llm_client
+
     def _create_llm_for_provider(self, provider: str) -> ILLMClient:
         """Create LLM client for the specified provider"""
-        if provider == "openai":
-            return OpenAILLMClient(self.settings_manager)
-        elif provider == "groq":
-            return GroqLLMClient(self.settings_manager)
-        elif provider == "local":
-            return PassthroughLLMClient()
-        else:
+        factory = self._FACTORIES.get(provider)
+        if factory is None:
             raise Exception(f"Unknown provider: {provider}")
+        return factory(self.settings_manager)
 
-    def get_last_used_llm_info(self) -> Dict[str, Any]:
+    def get_last_used_llm_info(self) -> Mapping[str, Any]:
         """Get information about the LLM used in the last processing call"""
-        return self._last_llm_info.copy()
+        return self._last_llm_info
+
+    def _record_success(self, provider: str, llm_client: ILLMClient) -> None:
+        """Record a successful LLM use, reusing the info built for its model"""
+        model_info = llm_client.get_model_info()
+        cached = self._success_info.get(provider)
+        if cached is not None and cached[0] is model_info:
+            self._last_llm_info = cached[1]
+            return
+
+        info = MappingProxyType(
+            {
+                "provider": model_info.get("provider", provider),
+                "model": model_info.get("model", "unknown"),
+                "success": True,
+                "error": None,
+            }
+        )
+        self._success_info[provider] = (model_info, info)
+        self._last_llm_info = info
+
+    def _record_error(self, provider: str, error: str) -> None:
+        """Record a failed LLM use"""
+        self._last_llm_info = MappingProxyType(
+            {
+                "provider": provider,
+                "model": "unknown",
+                "success": False,
+                "error": error,
+            }
+        )
 
     def get_available_llms(self) -> list:
         """Get list of currently available LLM providers for selected provider"""
@@ -109,7 +238,7 @@ class LLMRouter(ILLMRouter):
             provider_name = selected_provider.capitalize()
 
             # Check if the LLM client for this provider is actually available
-            llm_client = self._create_llm_for_provider(selected_provider)
+            llm_client = self.get_llm_client(selected_provider)
 
             if llm_client.is_available():
                 return [provider_name]
@@ -122,7 +251,7 @@ class LLMRouter(ILLMRouter):
         """Check if selected provider is available"""
         try:
             selected_provider = self.settings_manager.get_selected_provider()
-            llm_client = self._create_llm_for_provider(selected_provider)
+            llm_client = self.get_llm_client(selected_provider)
             return llm_client.is_available()
         except Exception:
             return False
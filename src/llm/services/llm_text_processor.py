@@ -1,8 +1,26 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Mapping, Optional, Tuple
 from src.interfaces.text_processing import ITextProcessor
 from src.llm.interfaces.llm_router import ILLMRouter
 from src.llm.services.prompt_loader import SimplePromptLoader
 from src.interfaces.settings import ISettingsManager
 
+logger = logging.getLogger(__name__)
+
+# Processed texts remembered for repeated short utterances ("ok", "send", ...)
+_RESPONSE_CACHE_SIZE = 256
+
+_CUSTOM_SECTION_HEADER = (
+    "\n\n## Additional Instructions\n\n"
+    "Also apply the following custom user preferences / instructions to the text: "
+)
+
+
+_CacheKey = Tuple[str, Any, bool, str, str]
+_CachedResponse = Tuple[str, Mapping[str, Any]]
+
 
 class LLMTextProcessor(ITextProcessor):
     """LLM-powered text processor with dynamic LLM routing"""
@@ -17,20 +35,31 @@ class LLMTextProcessor(ITextProcessor):
         self.settings_manager = settings_manager
         self.prompt_loader = prompt_loader or SimplePromptLoader()
 
+        # (provider, model, emit_thoughts, prompt, text) -> (processed text,
+        # LLM info of the call that produced it), least recently used first
+        self._responses: "OrderedDict[_CacheKey, _CachedResponse]" = OrderedDict()
+        self._responses_lock = threading.Lock()
+
+        # LLM info of the cached response last served, or None when the
+        # router's last-used info describes the last processed text
+        self._cached_llm_info: Optional[Mapping[str, Any]] = None
+
+        # Last (base prompt, custom instructions) and the prompt composed from
+        # them; reusing the same str also reuses its cached hash downstream
+        self._composed_prompt: Tuple[Tuple[str, str], str] = (("", ""), "")
+
     def process_text(self, text: str) -> str:
         """Process text through single LLM call with optional custom instructions"""
-        if not text or not text.strip():
-            return text
-
         # Store original text for fallback
-        original_text = text.strip()
+        original_text = text.strip() if text else ""
+        if not original_text:
+            return text
 
-        print(f"LLM Single-Call: Starting text processing")
-        print(f"   Input: '{original_text}'")
+        logger.debug("LLM Single-Call: processing '%.100s'", original_text)
 
         # Check if LLM router is available
         if not self.llm_router.is_available():
-            print("LLM router not available, returning original text")
+            logger.warning("LLM router not available, returning original text")
             return original_text
 
         try:
@@ -38,24 +67,32 @@ class LLMTextProcessor(ITextProcessor):
             try:
                 base_prompt = self.prompt_loader.get_transcription_prompt()
             except Exception as e:
-                print(f"Failed to load transcription prompt: {e}")
+                logger.error("Failed to load transcription prompt: %s", e)
                 return original_text
 
-            # Check for custom instructions and append if present
+            # Append custom instructions if present
             custom_instructions = self.settings_manager.get_custom_instructions()
-            if custom_instructions and custom_instructions.strip():
-                custom_section = f"\n\n## Additional Instructions\n\nAlso apply the following custom user preferences / instructions to the text: {custom_instructions}"
-                final_prompt = base_prompt + custom_section
-                print(
-                    f"Added custom instructions: '{custom_instructions[:50]}{'...' if len(custom_instructions) > 50 else ''}'"
-                )
-            else:
-                final_prompt = base_prompt
-                print("No custom instructions provided")
-
-            print("Making LLM router call...")
+            final_prompt = self._compose_prompt(base_prompt, custom_instructions)
+
+            # Same text under the same prompt, provider, model and reply
+            # format gives the same result
+            provider = self.settings_manager.get_selected_provider()
+            model_info = self.llm_router.get_llm_client(provider).get_model_info()
+            cache_key = (
+                provider,
+                model_info.get("model"),
+                self.settings_manager.get_emit_thoughts(),
+                final_prompt,
+                original_text,
+            )
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                cached_text, self._cached_llm_info = cached
+                logger.debug("LLM cache hit: '%.50s'", cached_text)
+                return cached_text
 
             # Single LLM call through router (with automatic fallback)
+            self._cached_llm_info = None
             processed_text = self.llm_router.process_with_best_llm(
                 final_prompt, original_text
             )
@@ -63,29 +100,63 @@ class LLMTextProcessor(ITextProcessor):
             # Log which LLM was actually used
             llm_info = self.llm_router.get_last_used_llm_info()
             if llm_info["success"]:
-                print(f"Used LLM: {llm_info['provider']} ({llm_info['model']})")
-            else:
-                print(f"LLM failed: {llm_info.get('error', 'Unknown error')}")
-
-            if (
-                processed_text
-                and processed_text.strip()
-                and processed_text != original_text
-            ):
-                result = processed_text.strip()
-                print(
-                    f"LLM processing complete: '{result[:50]}{'...' if len(result) > 50 else ''}'"
+                logger.debug(
+                    "Used LLM: %s (%s)", llm_info["provider"], llm_info["model"]
                 )
-                return result
             else:
-                print("LLM returned original text, no processing applied")
-                return original_text
+                logger.warning("LLM failed: %s", llm_info.get("error", "Unknown error"))
+
+            # The router already returns stripped text
+            if processed_text and processed_text != original_text:
+                logger.debug("LLM processing complete: '%.50s'", processed_text)
+                # Original text may be a fallback, so only rewrites are cached
+                if llm_info["success"]:
+                    self._cache_response(cache_key, (processed_text, llm_info))
+            else:
+                logger.debug("LLM returned original text, no processing applied")
+                processed_text = original_text
+
+            return processed_text
 
         except Exception as e:
-            print(f"LLM processing unexpected error: {e}")
-            print(f"Returning original text due to processing failure")
+            logger.error(
+                "LLM processing unexpected error, returning original text: %s", e
+            )
             return original_text
 
+    def _compose_prompt(self, base_prompt: str, custom_instructions: str) -> str:
+        """Get the base prompt with custom instructions, composing it on change"""
+        key = (base_prompt, custom_instructions)
+        cached_key, final_prompt = self._composed_prompt
+        if cached_key == key:
+            return final_prompt
+
+        if custom_instructions and custom_instructions.strip():
+            final_prompt = base_prompt + _CUSTOM_SECTION_HEADER + custom_instructions
+            logger.debug("Added custom instructions: '%.50s'", custom_instructions)
+        else:
+            final_prompt = base_prompt
+            logger.debug("No custom instructions provided")
+
+        self._composed_prompt = (key, final_prompt)
+        return final_prompt
+
+    def _get_cached_response(self, key: _CacheKey) -> Optional[_CachedResponse]:
+        """Get a previously processed text, marking it recently used"""
+        with self._responses_lock:
+            response = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+            return response
+
+    def _cache_response(self, key: _CacheKey, response: _CachedResponse) -> None:
+        """Remember a processed text, evicting the least recently used"""
+        with self._responses_lock:
+            self._responses[key] = response
+            self._responses.move_to_end(key)
+            if len(self._responses) > _RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+
     def get_processing_info(self) -> dict:
         """Get information about the current LLM processing configuration"""
         try:
@@ -96,7 +167,10 @@ class LLMTextProcessor(ITextProcessor):
 
             # Get router info
             available_llms = self.llm_router.get_available_llms()
-            last_used_llm = self.llm_router.get_last_used_llm_info()
+            # A cache hit skips the router, so its info is the cached call's
+            last_used_llm = (
+                self._cached_llm_info or self.llm_router.get_last_used_llm_info()
+            )
 
             return {
                 "llm_router": {
@@ -125,5 +199,5 @@ class PassthroughTextProcessor(ITextProcessor):
 
     def process_text(self, text: str) -> str:
         """Return text as-is with basic cleanup"""
-        print("Passthrough processor: No LLM processing")
+        logger.debug("Passthrough processor: No LLM processing")
         return text.strip() if text else ""
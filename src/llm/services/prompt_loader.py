@@ -1,4 +1,8 @@
+import logging
 import os
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class SimplePromptLoader:
@@ -7,18 +11,28 @@ class SimplePromptLoader:
     def __init__(self, prompts_directory: str = "prompts"):
         self.prompts_directory = prompts_directory
 
+        # (mtime_ns, prompt) of the last read, so the file is only re-read
+        # after it is edited
+        self._cached_prompt: Tuple[int, str] = (-1, "")
+
     def get_transcription_prompt(self) -> str:
         """Load the transcription rewrite prompt"""
         prompt_path = os.path.join(self.prompts_directory, "transcription_rewrite.md")
 
         try:
+            mtime = os.stat(prompt_path).st_mtime_ns
+            cached_mtime, prompt = self._cached_prompt
+            if mtime == cached_mtime:
+                return prompt
+
             with open(prompt_path, "r", encoding="utf-8") as f:
                 prompt = f.read().strip()
 
             if not prompt:
                 raise Exception(f"Empty prompt file: {prompt_path}")
 
-            print(f"Loaded transcription prompt from {prompt_path}")
+            self._cached_prompt = (mtime, prompt)
+            logger.debug("Loaded transcription prompt from %s", prompt_path)
             return prompt
 
         except FileNotFoundError:
@@ -1,5 +1,10 @@
+import time
 import sounddevice as sd
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Tuple
+
+# Seconds a device listing is reused; PortAudio enumeration is slow on some
+# hosts (100+ ms on Windows/WASAPI), and the list rarely changes
+_DEVICE_CACHE_TTL = 5.0
 
 
 class AudioDeviceInfo:
@@ -18,72 +23,98 @@ class AudioDeviceManager:
     """Manages audio input device enumeration and selection"""
 
     def __init__(self):
-        pass
-
-    def get_input_devices(self) -> List[AudioDeviceInfo]:
-        """Get all available input devices"""
-        devices = []
+        # (monotonic time, all devices, default input ID, input devices) from
+        # the last successful enumeration
+        self._cache: Optional[
+            Tuple[float, Any, Optional[int], List[AudioDeviceInfo]]
+        ] = None
+
+    def refresh(self) -> None:
+        """Drop the cached device list so the next lookup re-enumerates"""
+        self._cache = None
+
+    def _snapshot(self) -> Optional[Tuple[Any, Optional[int], List[AudioDeviceInfo]]]:
+        """Get all devices, the default input ID and the input devices together
+
+        One PortAudio query serves every lookup for a few seconds; returns
+        None if enumeration fails.
+        """
+        cache = self._cache
+        if cache is not None and time.monotonic() - cache[0] < _DEVICE_CACHE_TTL:
+            return cache[1], cache[2], cache[3]
 
         try:
-            # Get all available devices
             all_devices = sd.query_devices()
+            default_input_id = self._get_default_input_id()
+            input_devices = self._build_input_devices(all_devices, default_input_id)
+        except Exception as e:
+            print(f"Error getting input devices: {e}")
+            return None
 
-            # Get default input device
-            default_input_id = None
+        self._cache = (time.monotonic(), all_devices, default_input_id, input_devices)
+        return all_devices, default_input_id, input_devices
+
+    def _get_default_input_id(self) -> Optional[int]:
+        """Read the system default input device ID from sounddevice"""
+        try:
+            default_device = sd.default.device
+            if isinstance(default_device, (list, tuple)) and len(default_device) > 0:
+                return default_device[0]
+            elif isinstance(default_device, int):
+                return default_device
+        except:
+            pass
+        return None
+
+    def get_input_devices(self) -> List[AudioDeviceInfo]:
+        """Get all available input devices, reusing a recent enumeration"""
+        snapshot = self._snapshot()
+        if snapshot is None:
+            # Return at least the default option
+            return [
+                AudioDeviceInfo(device_id="default", name="Default", is_default=True)
+            ]
+        return list(snapshot[2])
+
+    def _build_input_devices(
+        self, all_devices, default_input_id: Optional[int]
+    ) -> List[AudioDeviceInfo]:
+        """Build the input device list, with the "Default" option first"""
+        devices = []
+
+        # Add "Default" option first
+        if default_input_id is not None:
             try:
-                default_device = sd.default.device
-                if (
-                    isinstance(default_device, (list, tuple))
-                    and len(default_device) > 0
-                ):
-                    default_input_id = default_device[0]
-                elif isinstance(default_device, int):
-                    default_input_id = default_device
-            except:
-                pass
-
-            # Add "Default" option first
-            if default_input_id is not None:
-                try:
-                    default_device_info = all_devices[default_input_id]
-                    default_name = default_device_info.get("name", "Unknown Device")
-                    devices.append(
-                        AudioDeviceInfo(
-                            device_id="default",
-                            name=f"Default ({default_name})",
-                            is_default=True,
-                        )
-                    )
-                except:
-                    devices.append(
-                        AudioDeviceInfo(
-                            device_id="default", name="Default", is_default=True
-                        )
+                default_device_info = all_devices[default_input_id]
+                default_name = default_device_info.get("name", "Unknown Device")
+                devices.append(
+                    AudioDeviceInfo(
+                        device_id="default",
+                        name=f"Default ({default_name})",
+                        is_default=True,
                     )
-            else:
+                )
+            except:
                 devices.append(
                     AudioDeviceInfo(
                         device_id="default", name="Default", is_default=True
                     )
                 )
+        else:
+            devices.append(
+                AudioDeviceInfo(device_id="default", name="Default", is_default=True)
+            )
 
-            # Add all input-capable devices
-            for i, device in enumerate(all_devices):
-                max_inputs = device.get("max_input_channels", 0)
-                if max_inputs > 0:
-                    device_name = device.get("name", f"Device {i}")
-                    devices.append(
-                        AudioDeviceInfo(device_id=i, name=device_name, is_default=False)
-                    )
+        # Add all input-capable devices
+        for i, device in enumerate(all_devices):
+            max_inputs = device.get("max_input_channels", 0)
+            if max_inputs > 0:
+                device_name = device.get("name", f"Device {i}")
+                devices.append(
+                    AudioDeviceInfo(device_id=i, name=device_name, is_default=False)
+                )
 
-            return devices
-
-        except Exception as e:
-            print(f"Error getting input devices: {e}")
-            # Return at least the default option
-            return [
-                AudioDeviceInfo(device_id="default", name="Default", is_default=True)
-            ]
+        return devices
 
     def get_device_by_id(self, device_id) -> Optional[AudioDeviceInfo]:
         """Get device info by ID"""
@@ -100,27 +131,25 @@ class AudioDeviceManager:
 
         try:
             device_id_int = int(device_id)
-            devices = sd.query_devices()
-            if 0 <= device_id_int < len(devices):
-                device = devices[device_id_int]
-                return device.get("max_inputs", 0) > 0
-        except (ValueError, IndexError):
-            pass
+        except ValueError:
+            return False
 
-        return False
+        # The listing only holds input-capable devices
+        return any(
+            device.device_id == device_id_int for device in self.get_input_devices()
+        )
 
     def get_default_device_info(self) -> Optional[Tuple[int, str]]:
         """Get the current system default input device ID and name"""
-        try:
-            default_device = sd.default.device
-            if isinstance(default_device, (list, tuple)) and len(default_device) > 0:
-                default_input_id = default_device[0]
-            elif isinstance(default_device, int):
-                default_input_id = default_device
-            else:
-                return None
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return None
 
-            devices = sd.query_devices()
+        devices, default_input_id, _ = snapshot
+        if default_input_id is None:
+            return None
+
+        try:
             if 0 <= default_input_id < len(devices):
                 device_info = devices[default_input_id]
                 device_name = device_info.get("name", "Unknown Device")
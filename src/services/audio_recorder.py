@@ -2,9 +2,12 @@ import sounddevice as sd
 import numpy as np
 import threading
 import queue
+import random
 import time
+from functools import lru_cache
 from typing import Optional
-from src.interfaces.audio_recorder import IAudioRecorder
+from src.interfaces.audio_recorder import IAudioRecorder, AudioBuffer
+from src.engines._wav import write_wav
 
 
 class PyAudioRecorder(IAudioRecorder):
@@ -32,6 +35,16 @@ class PyAudioRecorder(IAudioRecorder):
         # Debug: Show available audio devices
         self._print_audio_devices()
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def is_available() -> bool:
+        """Check once whether any audio input device is present"""
+        try:
+            devices = sd.query_devices()
+        except Exception:
+            return False
+        return any(device.get("max_input_channels", 0) > 0 for device in devices)
+
     def _parse_device_id(self, device_id):
         """Parse device ID to handle 'default' and integer IDs"""
         if device_id is None or device_id == "default":
@@ -47,6 +60,13 @@ class PyAudioRecorder(IAudioRecorder):
         try:
             print("\n🔍 Available Audio Devices:")
             devices = sd.query_devices()
+
+            # Looked up once; each access is a PortAudio call
+            try:
+                default_device = sd.default.device
+            except:
+                default_device = None
+
             for i, device in enumerate(devices):
                 device_type = ""
 
@@ -60,29 +80,24 @@ class PyAudioRecorder(IAudioRecorder):
                     device_type += "OUTPUT"
 
                 default_marker = ""
-                try:
-                    default_device = sd.default.device
-                    if isinstance(default_device, (list, tuple)):
-                        if len(default_device) > 0 and i == default_device[0]:
-                            default_marker = " ← DEFAULT INPUT"
-                        elif len(default_device) > 1 and i == default_device[1]:
-                            default_marker = " ← DEFAULT OUTPUT"
-                    else:
-                        if i == default_device:
-                            default_marker = " ← DEFAULT"
-                except:
-                    pass
+                if isinstance(default_device, (list, tuple)):
+                    if len(default_device) > 0 and i == default_device[0]:
+                        default_marker = " ← DEFAULT INPUT"
+                    elif len(default_device) > 1 and i == default_device[1]:
+                        default_marker = " ← DEFAULT OUTPUT"
+                elif i == default_device:
+                    default_marker = " ← DEFAULT"
 
                 device_name = device.get("name", "Unknown Device")
                 print(f"  {i}: {device_name} ({device_type}){default_marker}")
 
             # Show which device we'll use
-            try:
-                default_input = sd.default.device
+            if default_device is not None:
+                default_input = default_device
                 if isinstance(default_input, (list, tuple)):
                     default_input = default_input[0] if len(default_input) > 0 else None
                 print(f"🎤 Will use device: {default_input}\n")
-            except Exception as e:
+            else:
                 print(f"🎤 Using system default device\n")
 
         except Exception as e:
@@ -126,8 +141,8 @@ class PyAudioRecorder(IAudioRecorder):
                 self._stream.close()
                 self._stream = None
 
-    def stop_recording(self) -> Optional[bytes]:
-        """Stop recording and return audio data as bytes"""
+    def stop_recording(self) -> Optional[AudioBuffer]:
+        """Stop recording and return audio data as a byte buffer"""
         if not self._is_recording:
             return None
 
@@ -162,7 +177,10 @@ class PyAudioRecorder(IAudioRecorder):
             # Normalize and convert to 16-bit PCM
             audio_normalized = self._normalize_audio(audio_data)
             audio_int16 = (audio_normalized * 32767).astype(np.int16)
-            audio_bytes = audio_int16.tobytes()
+
+            # Hand out a byte view of the fresh int16 array instead of
+            # copying it again with tobytes()
+            audio_bytes = memoryview(audio_int16).cast("B")
 
             duration = len(audio_data) / self.sample_rate
             print(
@@ -242,10 +260,9 @@ class PyAudioRecorder(IAudioRecorder):
             print(f" Error normalizing audio: {e}")
             return audio_data
 
-    def _save_debug_wav(self, audio_bytes: bytes, duration: float) -> None:
+    def _save_debug_wav(self, audio_bytes: AudioBuffer, duration: float) -> None:
         """Debug: Save WAV file for manual inspection"""
         try:
-            import wave
             import os
 
             # Create debug directory if it doesn't exist
@@ -259,12 +276,9 @@ class PyAudioRecorder(IAudioRecorder):
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             wav_file_path = f"{debug_dir}/recording_{timestamp}.wav"
 
-            # Write WAV file
-            with wave.open(wav_file_path, "wb") as wav_file:
-                wav_file.setnchannels(1)  # Mono
-                wav_file.setsampwidth(2)  # 16-bit = 2 bytes
-                wav_file.setframerate(self.sample_rate)  # 16kHz
-                wav_file.writeframes(audio_bytes)
+            # Write WAV file straight from the PCM buffer, skipping the wave
+            # module and Python's buffered file layer
+            write_wav(wav_file_path, audio_bytes, self.sample_rate)
 
             print(f" Debug WAV saved: {wav_file_path} ({duration:.2f}s)")
             print(f"   You can play this file to verify audio quality")
@@ -323,6 +337,8 @@ class MockAudioRecorder(IAudioRecorder):
         self._is_recording = False
         self._start_time: Optional[float] = None
         self._mock_level = 0.0
+        # Private seeded generator: reproducible levels, no global RNG lookups
+        self._level_uniform = random.Random(0).uniform
 
     def start_recording(self) -> None:
         """Mock start recording"""
@@ -330,7 +346,7 @@ class MockAudioRecorder(IAudioRecorder):
         self._start_time = time.time()
         print(" Mock audio recording started")
 
-    def stop_recording(self) -> Optional[bytes]:
+    def stop_recording(self) -> Optional[AudioBuffer]:
         """Mock stop recording with fake audio data"""
         if not self._is_recording:
             return None
@@ -344,7 +360,7 @@ class MockAudioRecorder(IAudioRecorder):
         fake_audio = np.zeros(samples, dtype=np.int16)
 
         print(f" Mock audio recording completed: {duration:.2f}s")
-        return fake_audio.tobytes()
+        return memoryview(fake_audio).cast("B")
 
     def is_recording(self) -> bool:
         """Check if mock recording"""
@@ -354,9 +370,7 @@ class MockAudioRecorder(IAudioRecorder):
         """Get mock audio level"""
         if self._is_recording:
             # Simulate fluctuating audio level
-            import random
-
-            self._mock_level = random.uniform(0.2, 0.8)
+            self._mock_level = self._level_uniform(0.2, 0.8)
         else:
             self._mock_level = 0.0
         return self._mock_level
@@ -1,4 +1,8 @@
-from typing import Optional
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 from src.interfaces.speech_factory import ISpeechEngineRegistry
 from src.interfaces.speech import ISpeechEngine
 from src.interfaces.settings import ISettingsManager
@@ -11,6 +15,7 @@ from src.engines.speech_factories import (
     OpenAISpeechFactory,
     GroqSpeechFactory,
     LocalWhisperFactory,
+    OnnxWhisperFactory,
 )
 from src.services.recording_service import VoiceRecordingService
 from src.services.settings_manager import SettingsManager
@@ -19,12 +24,12 @@ from src.data.sqlite_data_store import SQLiteDataStore
 from src.services.text_processor import TextProcessor
 from src.services.audio_recorder import PyAudioRecorder, MockAudioRecorder
 from src.services.hotkey_handler import CmdOptionHandler, MockHotkeyHandler
+from src.services.lazy_proxy import LazyProxy
+from src.services.http_pool import KEEPALIVE_EXPIRY, warm_up_connection
 
 # LLM Pipeline imports
 from src.llm.interfaces.llm_client import ILLMClient
 from src.llm.interfaces.llm_router import ILLMRouter
-from src.llm.clients.openai_client import OpenAILLMClient
-from src.llm.clients.groq_client import GroqLLMClient
 from src.llm.clients.passthrough_client import PassthroughLLMClient
 from src.llm.services.llm_router import LLMRouter
 from src.llm.services.llm_text_processor import (
@@ -36,6 +41,8 @@ from src.llm.services.llm_text_processor import (
 from src.interfaces.speech_router import ISpeechEngineRouter
 from src.services.speech_engine_router import SpeechEngineRouter
 
+logger = logging.getLogger(__name__)
+
 
 class DIContainer:
     """Dependency Injection Container for managing application dependencies"""
@@ -48,6 +55,7 @@ class DIContainer:
         self._speech_registry: Optional[ISpeechEngineRegistry] = None
         self._audio_recorder: Optional[IAudioRecorder] = None
         self._hotkey_handler: Optional[IHotkeyHandler] = None
+        self._speech_engine: Optional[ISpeechEngine] = None
 
         # LLM Pipeline singletons
         self._llm_client: Optional[ILLMClient] = None
@@ -56,6 +64,18 @@ class DIContainer:
         # Speech Router singleton
         self._speech_router: Optional[ISpeechEngineRouter] = None
 
+        # Recording service singleton
+        self._recording_service: Optional[VoiceRecordingService] = None
+
+        # Provider connection warmups run on one reused worker; the last
+        # warmup time per provider skips them while the connection is pooled
+        self._connection_warmup_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="connection-warmup"
+        )
+        self._connection_warmed_at: Dict[str, float] = {}
+        # Warmups are requested from both the warmup thread and the Qt thread
+        self._connection_warmup_lock = threading.Lock()
+
         # Configuration flags
         self._use_mock_audio = False
         self._use_mock_hotkey = False
@@ -91,20 +111,12 @@ class DIContainer:
                 print("Using passthrough LLM client for testing")
                 self._llm_client = PassthroughLLMClient()
             else:
-                settings = self.get_settings_manager()
-                selected_provider = settings.get_selected_provider()
-
-                if selected_provider == "openai":
-                    self._llm_client = OpenAILLMClient(settings)
-                    print(f"Using OpenAI LLM client")
-                elif selected_provider == "groq":
-                    self._llm_client = GroqLLMClient(settings)
-                    print(f"Using Groq LLM client")
-                elif selected_provider == "local":
-                    self._llm_client = PassthroughLLMClient()
-                    print("Using passthrough LLM client (local provider)")
-                else:
-                    raise Exception(f"Unknown provider: {selected_provider}")
+                # The router owns provider dispatch, so share its client
+                selected_provider = self.get_settings_manager().get_selected_provider()
+                self._llm_client = self.get_llm_router().get_llm_client(
+                    selected_provider
+                )
+                print(f"Using {selected_provider} LLM client")
         return self._llm_client
 
     def get_llm_router(self) -> ILLMRouter:
@@ -157,10 +169,20 @@ class DIContainer:
                 print("Using mock audio recorder")
                 self._audio_recorder = MockAudioRecorder()
             else:
-                self._audio_recorder = PyAudioRecorder()
-                print("Using real audio recorder")
+                # Deferred until first use so device enumeration doesn't block startup
+                self._audio_recorder = LazyProxy(self._build_audio_recorder)
+                print("Using real audio recorder (lazy)")
         return self._audio_recorder
 
+    def _build_audio_recorder(self) -> IAudioRecorder:
+        """Construct the real audio recorder, or a mock if no input device exists"""
+        if not PyAudioRecorder.is_available():
+            print("No audio input device found, using mock audio recorder")
+            return MockAudioRecorder()
+        recorder = PyAudioRecorder()
+        print("Real audio recorder initialized")
+        return recorder
+
     def get_hotkey_handler(self) -> IHotkeyHandler:
         """Get hotkey handler (mock or real based on configuration)"""
         if self._hotkey_handler is None:
@@ -173,20 +195,47 @@ class DIContainer:
         return self._hotkey_handler
 
     def get_speech_engine(self) -> ISpeechEngine:
-        """Get the best available speech engine"""
+        """Get the best available speech engine (built lazily on first use)"""
+        if self._speech_engine is None:
+            self._speech_engine = LazyProxy(self._build_speech_engine)
+        return self._speech_engine
+
+    def _build_speech_engine(self) -> ISpeechEngine:
+        """Construct the best available speech engine"""
         registry = self.get_speech_registry()
         settings = self.get_settings_manager()
         return registry.create_best_engine(settings)
 
     def get_recording_service(self) -> VoiceRecordingService:
-        """Get recording service with all dependencies injected"""
-        return VoiceRecordingService(
-            speech_router=self.get_speech_router(),
-            data_store=self.get_data_store(),
-            hotkey_handler=self.get_hotkey_handler(),
-            text_processor=self.get_text_processor(),
-            audio_recorder=self.get_audio_recorder(),
-        )
+        """Get recording service singleton with all dependencies injected"""
+        if self._recording_service is None:
+            self._recording_service = VoiceRecordingService(
+                speech_router=self.get_speech_router(),
+                data_store=self.get_data_store(),
+                hotkey_handler=self.get_hotkey_handler(),
+                text_processor=self.get_text_processor(),
+                audio_recorder=self.get_audio_recorder(),
+            )
+            # Speech and LLM requests follow the recording, so have the
+            # provider connection open while the user is still speaking
+            self._recording_service.recording_started.connect(
+                self._warm_up_provider_connection
+            )
+        return self._recording_service
+
+    def _warm_up_provider_connection(self):
+        """Open a connection to the selected provider's API in the background"""
+        provider = self.get_settings_manager().get_selected_provider()
+
+        # A warmed connection stays pooled until its keep-alive expiry
+        with self._connection_warmup_lock:
+            now = time.monotonic()
+            warmed_at = self._connection_warmed_at.get(provider)
+            if warmed_at is not None and now - warmed_at < KEEPALIVE_EXPIRY:
+                return
+            self._connection_warmed_at[provider] = now
+
+        self._connection_warmup_executor.submit(warm_up_connection, provider)
 
     def _register_speech_engines(self):
         """Register all available speech engines with priorities"""
@@ -206,6 +255,11 @@ class DIContainer:
             name="local_whisper", factory=LocalWhisperFactory(), priority=10
         )
 
+        # ONNX Runtime INT8 Whisper, used for the local provider when selected
+        registry.register_engine(
+            name="onnx_whisper", factory=OnnxWhisperFactory(), priority=5
+        )
+
     def create_speech_engine_by_name(self, engine_name: str) -> ISpeechEngine:
         """Create a specific speech engine by name"""
         registry = self.get_speech_registry()
@@ -238,8 +292,35 @@ class DIContainer:
         print("  - Text processor...")
         self.get_text_processor()
 
+        # Heavy objects (audio device, speech model) are warmed up in the
+        # background once the event loop runs, so the main window paints first
+        from PySide6.QtCore import QTimer
+
+        QTimer.singleShot(0, self._start_warmup)
+
         print("Critical services initialized successfully")
 
+    def _start_warmup(self):
+        """Start the background warmup thread"""
+        threading.Thread(target=self._warmup_services, daemon=True).start()
+
+    def _warmup_services(self):
+        """Materialize lazily-built services off the UI thread"""
+        try:
+            # Have a connection to the cloud provider ready for the first use;
+            # opened first so a slow local model load doesn't hold it up
+            self._warm_up_provider_connection()
+
+            audio_recorder = self.get_audio_recorder()
+            if isinstance(audio_recorder, LazyProxy):
+                audio_recorder.materialize()
+
+            # Build the engine transcription will actually use
+            self.get_speech_router().warm_up()
+            logger.info("Background warmup completed")
+        except Exception as e:
+            logger.error("Background warmup failed: %s", e)
+
     def reset(self):
         """Reset all singletons (useful for testing)"""
         self._settings_manager = None
@@ -248,7 +329,9 @@ class DIContainer:
         self._speech_registry = None
         self._audio_recorder = None
         self._hotkey_handler = None
+        self._speech_engine = None
         self._llm_client = None
         self._llm_router = None
         self._speech_router = None
+        self._recording_service = None
         print("DI Container reset")
@@ -0,0 +1,62 @@
+import importlib.util
+import threading
+from typing import Any, Optional
+
+# One pooled HTTP client shared by every provider SDK, so keep-alive
+# connections (and their TLS sessions) survive across requests
+_http_client: Optional[Any] = None
+_http_client_lock = threading.Lock()
+
+# Idle connections kept open per pool
+MAX_KEEPALIVE_CONNECTIONS = 4
+
+# Seconds an idle connection stays pooled. Dictations arrive seconds apart,
+# so outlast httpx's 5 s default to keep the TLS session between them.
+KEEPALIVE_EXPIRY = 30.0
+
+# Endpoints on each cloud provider's API host, used to open a connection
+# before the first real request
+_PROVIDER_WARMUP_URLS = {
+    "openai": "https://api.openai.com/v1/models",
+    "groq": "https://api.groq.com/openai/v1/models",
+}
+
+
+def get_http_client():
+    """Get the shared httpx client, creating it on first use"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                # Imported here so httpx only loads when a cloud provider is used
+                import httpx
+
+                # Accept-Encoding is left to httpx: it adds br and zstd to
+                # gzip/deflate when brotli and zstandard are installed, and
+                # only offers encodings it can decode
+                _http_client = httpx.Client(
+                    # HTTP/2 needs the optional h2 package
+                    http2=importlib.util.find_spec("h2") is not None,
+                    timeout=httpx.Timeout(30.0, connect=3.0),
+                    limits=httpx.Limits(
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=KEEPALIVE_EXPIRY,
+                    ),
+                )
+    return _http_client
+
+
+def warm_up_connection(provider: str) -> None:
+    """Open a pooled connection to a provider's API host ahead of first use
+
+    The unauthenticated HEAD is rejected, but the TCP + TLS session it sets up
+    stays in the pool for the provider SDK's first real request.
+    """
+    url = _PROVIDER_WARMUP_URLS.get(provider)
+    if url is None:
+        return
+
+    try:
+        get_http_client().head(url, timeout=2.0)
+    except Exception:
+        pass  # Best effort; the first request will just connect itself
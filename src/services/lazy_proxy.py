@@ -0,0 +1,33 @@
+import threading
+from typing import Any, Callable
+
+
+class LazyProxy:
+    """Proxy that builds its target on first use and forwards attribute access to it"""
+
+    def __init__(self, factory: Callable[[], Any]):
+        # Bypass __setattr__ so these never get forwarded to the target
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def materialize(self) -> Any:
+        """Build the target once (thread-safe) and return it"""
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    target = self._factory()
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    def is_materialized(self) -> bool:
+        """Check if the target has already been built"""
+        return self._target is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.materialize(), name, value)
@@ -1,16 +1,20 @@
+import logging
 from src.interfaces.speech_router import ISpeechEngineRouter
 from src.interfaces.data_store import IDataStore, TranscriptEntry
 from src.interfaces.hotkey import IHotkeyHandler
 from src.interfaces.text_processing import ITextProcessor
-from src.interfaces.audio_recorder import IAudioRecorder
+from src.interfaces.audio_recorder import IAudioRecorder, AudioBuffer
 from src.interfaces.text_insertion import ITextInserter
 from src.services.text_inserter_factory import TextInserterFactory
+from src.engines._vad import has_speech
 from PySide6.QtCore import QObject, Signal
 from datetime import datetime
 import time
 import os
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 
 class VoiceRecordingService(QObject):
     """Main service that coordinates voice recording workflow"""
@@ -52,27 +56,27 @@ class VoiceRecordingService(QObject):
 
     def start_service(self):
         """Start the voice recording service"""
-        print("Starting Open Voice recording service...")
+        logger.info("Starting Open Voice recording service...")
         self.hotkey_handler.start_listening()
-        print("Service started. Press Fn key to record.")
+        logger.info("Service started. Press Fn key to record.")
 
     def stop_service(self):
         """Stop the voice recording service"""
-        print("Stopping Open Voice recording service...")
+        logger.info("Stopping Open Voice recording service...")
         self.hotkey_handler.stop_listening()
 
         # Emit signal to hide overlay if recording
         if self.is_recording:
             self.recording_stopped.emit()
 
-        print("Service stopped.")
+        logger.info("Service stopped.")
 
     def start_recording(self):
         """Start recording when hotkey is pressed"""
         if self.is_recording:
             return
 
-        print("🔴 Recording started")
+        logger.debug("Recording started")
         self.is_recording = True
         self.recording_start_time = time.time()
 
@@ -90,7 +94,7 @@ class VoiceRecordingService(QObject):
         if not self.is_recording:
             return
 
-        print("⚫ Recording stopped")
+        logger.debug("Recording stopped")
         self.is_recording = False
 
         # Stop audio recording and get audio data
@@ -108,24 +112,29 @@ class VoiceRecordingService(QObject):
         # Process the real recording
         self.process_recording(duration, audio_data)
 
-    def process_recording(self, duration: float, audio_data: Optional[bytes] = None):
+    def process_recording(
+        self, duration: float, audio_data: Optional[AudioBuffer] = None
+    ):
         """Process the completed recording"""
         try:
             # Check if we have audio data
             if not audio_data:
-                print("No audio data available - aborting processing")
+                logger.debug("No audio data available - aborting processing")
                 return
 
             # Check if audio recorder detected silence (returns empty bytes)
             if len(audio_data) == 0:
-                print("Silence detected by audio recorder - aborting processing")
+                logger.debug("Silence detected by audio recorder - aborting processing")
                 return  # Early exit - no transcription, no text insertion
 
-            print(f"Processing real audio data ({len(audio_data)} bytes)")
+            logger.debug("Processing real audio data (%d bytes)", len(audio_data))
 
-            # Additional silence check using our own analysis (backup)
-            if self._is_silent_audio(audio_data):
-                print("No speech detected by secondary analysis - aborting processing")
+            # Additional silence check using our own analysis (backup); this
+            # is the only gate, so silent clips never reach a speech engine
+            if not has_speech(audio_data):
+                logger.debug(
+                    "No speech detected by secondary analysis - aborting processing"
+                )
                 return  # Early exit - no transcription, no text insertion
 
             # Only proceed if we detected actual speech
@@ -134,9 +143,13 @@ class VoiceRecordingService(QObject):
             # Log which engine was actually used
             engine_info = self.speech_router.get_last_used_engine_info()
             if engine_info["success"]:
-                print(f"Used engine: {engine_info['name']} ({engine_info['provider']})")
+                logger.debug(
+                    "Used engine: %s (%s)", engine_info["name"], engine_info["provider"]
+                )
             else:
-                print(f"Engine failed: {engine_info.get('error', 'Unknown error')}")
+                logger.warning(
+                    "Engine failed: %s", engine_info.get("error", "Unknown error")
+                )
 
             # Process text through LLM pipeline
             processed_text = self.text_processor.process_text(original_text)
@@ -145,36 +158,23 @@ class VoiceRecordingService(QObject):
             provider_info = self.speech_router.get_last_used_engine_info()
             provider_used = provider_info.get("provider", "unknown")
 
-            # Save to data store first (without audio path) to get transcript ID
-            transcript_id = self.data_store.save_transcript(
-                original_text=original_text,
-                processed_text=processed_text,
-                duration=duration,
-                audio_file_path=None,  # Will update this after saving audio
-                provider_used=provider_used,
-            )
-
-            # Now save audio file with correct transcript ID
-            audio_file_path = None
+            # Save transcript and its audio file together in one transaction
             try:
-                audio_file_path = self.data_store.save_audio_file(
-                    audio_data, transcript_id
-                )
-                print(f"Saved audio file: {audio_file_path}")
-
-                # Update the transcript record with the audio file path
-                if audio_file_path:
-                    success = self.data_store.update_audio_path(
-                        transcript_id, audio_file_path
+                transcript_id, audio_file_path = (
+                    self.data_store.save_transcript_with_audio(
+                        original_text=original_text,
+                        processed_text=processed_text,
+                        duration=duration,
+                        audio_data=audio_data,
+                        provider_used=provider_used,
                     )
-                    if not success:
-                        print(
-                            f"Failed to update audio path in database for transcript {transcript_id}"
-                        )
-
+                )
             except Exception as e:
-                print(f"Failed to save audio file: {e}")
-                audio_file_path = None
+                # The dictation is still inserted when history can't be saved
+                logger.error("Failed to save transcript: %s", e)
+                self.insert_text(processed_text, None)
+                return
+            logger.debug("Saved audio file: %s", audio_file_path)
 
             # Create transcript entry for UI
             entry = TranscriptEntry(
@@ -194,57 +194,64 @@ class VoiceRecordingService(QObject):
             # Insert processed text into target application
             self.insert_text(processed_text, transcript_id)
 
-            print(f"Transcript created: '{original_text}' (Duration: {duration:.1f}s)")
+            logger.debug(
+                "Transcript created: '%.100s' (Duration: %.1fs)",
+                original_text,
+                duration,
+            )
 
         except Exception as e:
-            print(f"Error processing recording: {e}")
+            logger.error("Error processing recording: %s", e)
 
     def _store_focus_if_supported(self):
         """Store current focus if the text inserter supports focus management"""
         try:
             if hasattr(self.text_inserter, "store_current_focus"):
-                print("Storing focus before recording...")
+                logger.debug("Storing focus before recording...")
                 success = self.text_inserter.store_current_focus()
                 if success:
-                    print("Focus stored successfully")
+                    logger.debug("Focus stored successfully")
                 else:
-                    print(
+                    logger.debug(
                         "Could not store focus, will use current focus when inserting"
                     )
             else:
-                print("ℹText inserter does not support focus management")
+                logger.debug("Text inserter does not support focus management")
         except Exception as e:
-            print(f"Error storing focus: {e}")
+            logger.error("Error storing focus: %s", e)
 
-    def insert_text(self, text: str, transcript_id: int):
-        """Insert text with focus management if supported"""
+    def insert_text(self, text: str, transcript_id: Optional[int]):
+        """Insert text with focus management if supported
+
+        transcript_id is None when the transcript could not be saved.
+        """
         try:
             if not text.strip():
-                print("Empty text, skipping insertion")
+                logger.debug("Empty text, skipping insertion")
                 self.data_store.mark_insertion_status(transcript_id, True)
                 return
 
-            print(f"Inserting text: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+            logger.debug("Inserting text: '%.50s'", text)
 
             # Try focus-aware insertion first if supported
             success = False
             if hasattr(self.text_inserter, "insert_text_with_focus_management"):
-                print("Using focus-aware text insertion")
+                logger.debug("Using focus-aware text insertion")
                 success = self.text_inserter.insert_text_with_focus_management(text)
             else:
-                print("Using standard text insertion")
+                logger.debug("Using standard text insertion")
                 success = self.text_inserter.insert_text(text)
 
             if success:
-                print(f"Text insertion successful")
+                logger.debug("Text insertion successful")
             else:
-                print(f"Text insertion failed")
+                logger.warning("Text insertion failed")
 
             # Mark insertion status in database
             self.data_store.mark_insertion_status(transcript_id, success)
 
         except Exception as e:
-            print(f"Text insertion error: {e}")
+            logger.error("Text insertion error: %s", e)
             self.data_store.mark_insertion_status(transcript_id, False)
 
     def get_text_inserter_info(self) -> dict:
@@ -256,9 +263,9 @@ class VoiceRecordingService(QObject):
         if inserter and inserter.is_available():
             self.text_inserter = inserter
             capabilities = inserter.get_capabilities()
-            print(f"Text inserter changed to: {capabilities['name']}")
+            logger.info("Text inserter changed to: %s", capabilities["name"])
         else:
-            print("Cannot set text inserter: not available or invalid")
+            logger.warning("Cannot set text inserter: not available or invalid")
 
     def get_speech_router_info(self) -> dict:
         """Get information about the speech router and available engines"""
@@ -279,52 +286,6 @@ class VoiceRecordingService(QObject):
                 "router_available": False,
             }
 
-    def _is_silent_audio(self, audio_data: bytes) -> bool:
-        """Check if audio data contains meaningful speech content"""
-        try:
-            import struct
-
-            # Convert bytes to 16-bit samples (our audio format: 16kHz, 16-bit, mono)
-            if len(audio_data) < 2:
-                return True  # Too little data
-
-            samples = struct.unpack(f"<{len(audio_data)//2}h", audio_data)
-
-            if len(samples) == 0:
-                return True
-
-            # Calculate RMS (Root Mean Square) amplitude
-            rms = (sum(sample**2 for sample in samples) / len(samples)) ** 0.5
-
-            # Thresholds for silence detection
-            SILENCE_THRESHOLD = 500  # Below this = silence
-            MIN_DYNAMIC_RANGE = 100  # Variation needed for speech
-
-            print(f"Audio analysis: RMS={rms:.1f}, samples={len(samples)}")
-
-            # Check 1: Overall amplitude
-            if rms < SILENCE_THRESHOLD:
-                print(f"   Too quiet (RMS {rms:.1f} < {SILENCE_THRESHOLD})")
-                return True
-
-            # Check 2: Dynamic range (speech has variation)
-            max_sample = max(abs(s) for s in samples)
-            min_sample = min(abs(s) for s in samples)
-            dynamic_range = max_sample - min_sample
-
-            print(f"   Dynamic range: {dynamic_range} (min: {MIN_DYNAMIC_RANGE})")
-
-            if dynamic_range < MIN_DYNAMIC_RANGE:
-                print(f"   Too static (range {dynamic_range} < {MIN_DYNAMIC_RANGE})")
-                return True  # Likely just consistent background noise
-
-            print("   Speech detected - proceeding with transcription")
-            return False  # Probably contains speech
-
-        except Exception as e:
-            print(f"Audio analysis failed: {e}")
-            return False  # When in doubt, process it
-
     def get_audio_recorder(self) -> IAudioRecorder:
         """Get the audio recorder instance for real-time level monitoring"""
         return self.audio_recorder
@@ -348,14 +309,14 @@ class MockVoiceRecordingService(QObject):
         self.text_index = 0
 
     def start_service(self):
-        print("Mock recording service started")
+        logger.info("Mock recording service started")
 
     def stop_service(self):
-        print("Mock recording service stopped")
+        logger.info("Mock recording service stopped")
 
     def simulate_recording(self):
         """Simulate a complete recording cycle"""
-        print("Mock recording started")
+        logger.debug("Mock recording started")
 
         # Get next mock text
         text = self.mock_texts[self.text_index]
@@ -373,7 +334,7 @@ class MockVoiceRecordingService(QObject):
             provider_used="mock",
         )
 
-        print(f"Mock recording completed: '{text}'")
+        logger.debug("Mock recording completed: '%s'", text)
 
         # Emit signal
         self.transcript_created.emit(entry)
@@ -19,6 +19,9 @@ class SettingsManager(QObject, ISettingsManager, metaclass=ABCQObjectMeta):
     def __init__(self):
         super().__init__()
 
+        # Bumped on every change so callers can cache derived values
+        self._version = 0
+
         # Settings storage (in-memory, no persistence)
         self._settings = {
             "selected_provider": "local",  # Default to local provider
@@ -27,8 +30,21 @@ class SettingsManager(QObject, ISettingsManager, metaclass=ABCQObjectMeta):
                 "groq": "",
             },
             "custom_instructions": "",
+            # JSON replies with the model's reasoning; slower, for debugging
+            "emit_thoughts": False,
             "selected_microphone_id": "default",  # Default to system default
             "selected_microphone_name": "Default",  # Display name for UI
+            "local_whisper": {
+                "backend": "faster_whisper",  # or "onnx" (sherpa-onnx INT8)
+                "onnx_model_dir": None,  # Directory with the ONNX export
+                "model_size": "base",  # ".en" variant is used for English
+                # "auto" lets CTranslate2 pick the device and the fastest
+                # supported precision (e.g. int8 on CPU, float16 on CUDA)
+                "device": "auto",
+                "compute_type": "auto",
+                "language": None,  # None = detect once, then reuse
+                "beam_size": 1,  # Greedy decoding; raise for accuracy
+            },
         }
 
     def get_selected_provider(self) -> str:
@@ -44,6 +60,7 @@ class SettingsManager(QObject, ISettingsManager, metaclass=ABCQObjectMeta):
             )
 
         self._settings["selected_provider"] = provider
+        self._version += 1
         self.setting_changed.emit("selected_provider", provider)
         print(f"Provider updated to: {provider}")
 
@@ -64,6 +81,7 @@ class SettingsManager(QObject, ISettingsManager, metaclass=ABCQObjectMeta):
             self._settings["provider_api_keys"][provider] = ""
 
         self._settings["provider_api_keys"][provider] = api_key
+        self._version += 1
         self.setting_changed.emit(f"provider_api_key_{provider}", api_key)
 
     def get_custom_instructions(self) -> str:
@@ -73,8 +91,19 @@ class SettingsManager(QObject, ISettingsManager, metaclass=ABCQObjectMeta):
     def set_custom_instructions(self, instructions: str) -> None:
         """Set custom instructions"""
         self._settings["custom_instructions"] = instructions
+        self._version += 1
         self.setting_changed.emit("custom_instructions", instructions)
 
+    def get_emit_thoughts(self) -> bool:
+        """Get whether the LLM should also return its reasoning"""
+        return self._settings["emit_thoughts"]
+
+    def set_emit_thoughts(self, enabled: bool) -> None:
+        """Set whether the LLM should also return its reasoning"""
+        self._settings["emit_thoughts"] = enabled
+        self._version += 1
+        self.setting_changed.emit("emit_thoughts", str(enabled))
+
     def get_selected_microphone_id(self) -> str:
         """Get selected microphone device ID"""
         return self._settings["selected_microphone_id"]
@@ -87,10 +116,42 @@ class SettingsManager(QObject, ISettingsManager, metaclass=ABCQObjectMeta):
         """Set selected microphone device"""
         self._settings["selected_microphone_id"] = device_id
         self._settings["selected_microphone_name"] = device_name
+        self._version += 1
         self.setting_changed.emit("selected_microphone_id", device_id)
         self.setting_changed.emit("selected_microphone_name", device_name)
         print(f"Microphone updated to: {device_name} (ID: {device_id})")
 
+    def get_local_whisper_settings(self) -> dict:
+        """Get local Whisper model options (device, compute_type, ...)"""
+        return self._settings["local_whisper"].copy()
+
+    def set_local_whisper_setting(self, name: str, value) -> None:
+        """Set a single local Whisper model option"""
+        if name not in self._settings["local_whisper"]:
+            raise ValueError(f"Unknown local Whisper setting '{name}'")
+
+        # Quantized types supported by CTranslate2; "auto" picks int8 on CPU
+        # and int8_float16/float16 on CUDA
+        valid_compute_types = ["auto", "int8", "int8_float16", "float16", "float32"]
+        if name == "compute_type" and value not in valid_compute_types:
+            raise ValueError(
+                f"Invalid compute type '{value}'. Must be one of: {valid_compute_types}"
+            )
+
+        valid_backends = ["faster_whisper", "onnx"]
+        if name == "backend" and value not in valid_backends:
+            raise ValueError(
+                f"Invalid backend '{value}'. Must be one of: {valid_backends}"
+            )
+
+        self._settings["local_whisper"][name] = value
+        self._version += 1
+        self.setting_changed.emit(f"local_whisper_{name}", str(value))
+
+    def get_settings_version(self) -> int:
+        """Get a counter that increases whenever any setting changes"""
+        return self._version
+
     def get_all(self) -> dict:
         """Get all settings"""
         return self._settings.copy()
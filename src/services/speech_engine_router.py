@@ -1,8 +1,12 @@
+import logging
 from typing import Dict, Any
 from src.interfaces.speech_router import ISpeechEngineRouter
 from src.interfaces.speech_factory import ISpeechEngineRegistry
 from src.interfaces.settings import ISettingsManager
 from src.interfaces.speech import ISpeechEngine
+from src.interfaces.audio_recorder import AudioBuffer
+
+logger = logging.getLogger(__name__)
 
 
 class SpeechEngineRouter(ISpeechEngineRouter):
@@ -24,7 +28,7 @@ class SpeechEngineRouter(ISpeechEngineRouter):
             "error": None,
         }
 
-    def transcribe_with_fallback(self, audio_data: bytes) -> str:
+    def transcribe_with_fallback(self, audio_data: AudioBuffer) -> str:
         """Transcribe audio using selected provider only (no fallbacks)"""
         if not audio_data:
             self._last_engine_info = {
@@ -39,30 +43,7 @@ class SpeechEngineRouter(ISpeechEngineRouter):
         selected_provider = self.settings_manager.get_selected_provider()
 
         try:
-            # Get engine ID for selected provider
-            engine_id = self._get_engine_id_for_provider(selected_provider)
-
-            if not engine_id:
-                raise Exception(
-                    f"No speech engine available for provider: {selected_provider}"
-                )
-
-            print(f"Using {selected_provider} speech provider")
-
-            # Create engine for selected provider
-            engine = self.speech_registry.create_engine_by_name(
-                engine_id, self.settings_manager
-            )
-
-            # Check if engine is available
-            if not engine.is_available():
-                if selected_provider == "local":
-                    # Local provider should always be available
-                    pass
-                else:
-                    raise Exception(
-                        f"{selected_provider} speech engine not available - check API key"
-                    )
+            engine = self._get_engine_for_provider(selected_provider)
 
             # Transcribe with selected provider
             result = engine.transcribe(audio_data)
@@ -78,7 +59,9 @@ class SpeechEngineRouter(ISpeechEngineRouter):
             return result.strip() if result else "Could not understand audio"
 
         except Exception as e:
-            print(f"Speech transcription failed with {selected_provider} provider: {e}")
+            logger.error(
+                "Speech transcription failed with %s provider: %s", selected_provider, e
+            )
 
             # Record failure
             self._last_engine_info = {
@@ -91,6 +74,37 @@ class SpeechEngineRouter(ISpeechEngineRouter):
             # No fallback - raise exception to inform user
             raise Exception(f"Speech transcription failed: {e}")
 
+    def warm_up(self) -> None:
+        """Build the selected provider's engine ahead of the first transcription"""
+        self._get_engine_for_provider(self.settings_manager.get_selected_provider())
+
+    def _get_engine_for_provider(self, provider: str) -> ISpeechEngine:
+        """Get the engine for the selected provider, checking it can be used"""
+        # Get engine ID for selected provider
+        engine_id = self._get_engine_id_for_provider(provider)
+
+        if not engine_id:
+            raise Exception(f"No speech engine available for provider: {provider}")
+
+        logger.debug("Using %s speech provider", provider)
+
+        # Create engine for selected provider
+        engine = self.speech_registry.create_engine_by_name(
+            engine_id, self.settings_manager
+        )
+
+        # Check if engine is available
+        if not engine.is_available():
+            if provider == "local":
+                # Local provider should always be available
+                pass
+            else:
+                raise Exception(
+                    f"{provider} speech engine not available - check API key"
+                )
+
+        return engine
+
     def _get_engine_id_for_provider(self, provider: str) -> str:
         """Get engine ID for the specified provider"""
         provider_engine_map = {
@@ -103,6 +117,12 @@ class SpeechEngineRouter(ISpeechEngineRouter):
         if not engine_id:
             raise Exception(f"Unknown provider: {provider}")
 
+        # The local provider can run on either Whisper backend
+        if provider == "local":
+            options = self.settings_manager.get_local_whisper_settings()
+            if options.get("backend") == "onnx":
+                engine_id = "onnx_whisper"
+
         return engine_id
 
     def _get_engine_name_for_provider(self, provider: str) -> str:
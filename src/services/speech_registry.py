@@ -1,8 +1,12 @@
-from typing import Dict, List, Tuple, Any
+import logging
+import threading
+from typing import Dict, Hashable, List, Optional, Tuple, Any
 from src.interfaces.speech_factory import ISpeechEngineFactory, ISpeechEngineRegistry
 from src.interfaces.speech import ISpeechEngine
 from src.interfaces.settings import ISettingsManager
 
+logger = logging.getLogger(__name__)
+
 
 class SpeechEngineRegistry(ISpeechEngineRegistry):
     """Registry for managing speech engine factories with priority-based selection"""
@@ -11,6 +15,17 @@ class SpeechEngineRegistry(ISpeechEngineRegistry):
         # Store as (factory, priority) tuples, sorted by priority descending
         self._engines: Dict[str, Tuple[ISpeechEngineFactory, int]] = {}
 
+        # Built engines as (settings, factory settings key, engine), reused
+        # until the settings that engine reads change
+        self._instances: Dict[
+            str, Tuple[ISettingsManager, Hashable, ISpeechEngine]
+        ] = {}
+        self._instances_lock = threading.Lock()
+
+        # Name picked by create_best_engine as (settings, settings version,
+        # name), so the priority ladder only reruns after settings change
+        self._best: Optional[Tuple[ISettingsManager, int, str]] = None
+
     def register_engine(
         self, name: str, factory: ISpeechEngineFactory, priority: int = 0
     ) -> None:
@@ -19,13 +34,35 @@ class SpeechEngineRegistry(ISpeechEngineRegistry):
             raise ValueError(f"Factory must implement ISpeechEngineFactory interface")
 
         self._engines[name] = (factory, priority)
-        print(f"🔧 Registered speech engine: {name} (priority: {priority})")
+        self._instances.pop(name, None)
+        self._best = None
+        logger.debug("Registered speech engine: %s (priority: %d)", name, priority)
+
+    def _get_or_create_engine(
+        self, name: str, factory: ISpeechEngineFactory, settings: ISettingsManager
+    ) -> ISpeechEngine:
+        """Return the cached engine for name, building it if its settings changed"""
+        key = factory.get_settings_key(settings)
+        with self._instances_lock:
+            cached = self._instances.get(name)
+            if cached is not None and cached[0] is settings and cached[1] == key:
+                return cached[2]
+
+            engine = factory.create_engine(settings)
+            self._instances[name] = (settings, key, engine)
+            return engine
 
     def create_best_engine(self, settings: ISettingsManager) -> ISpeechEngine:
         """Create the best available speech engine based on priority and availability"""
         if not self._engines:
             raise RuntimeError("No speech engines registered")
 
+        version = settings.get_settings_version()
+        best = self._best
+        if best is not None and best[0] is settings and best[1] == version:
+            name = best[2]
+            return self._get_or_create_engine(name, self._engines[name][0], settings)
+
         # Sort by priority (highest first)
         sorted_engines = sorted(
             self._engines.items(),
@@ -36,12 +73,16 @@ class SpeechEngineRegistry(ISpeechEngineRegistry):
         for name, (factory, priority) in sorted_engines:
             try:
                 if factory.is_available(settings):
-                    print(f"🚀 Selected speech engine: {name} (priority: {priority})")
-                    return factory.create_engine(settings)
+                    logger.info(
+                        "Selected speech engine: %s (priority: %d)", name, priority
+                    )
+                    engine = self._get_or_create_engine(name, factory, settings)
+                    self._best = (settings, version, name)
+                    return engine
                 else:
-                    print(f"⚠️ Engine {name} not available")
+                    logger.debug("Engine %s not available", name)
             except Exception as e:
-                print(f"⚠️ Failed to create engine {name}: {e}")
+                logger.warning("Failed to create engine %s: %s", name, e)
 
         # If no engines are available, raise an error
         raise RuntimeError("No speech engines are available")
@@ -63,29 +104,19 @@ class SpeechEngineRegistry(ISpeechEngineRegistry):
                 f"Engine '{name}' is not available with current settings"
             )
 
-        return factory.create_engine(settings)
+        return self._get_or_create_engine(name, factory, settings)
 
     def get_available_engines(self, settings: ISettingsManager) -> List[Dict[str, Any]]:
         """Get list of available engines with their info"""
         available_engines = []
 
-        for name, (factory, priority) in self._engines.items():
-            try:
-                engine_info = factory.get_engine_info().copy()
-                engine_info.update(
-                    {"available": factory.is_available(settings), "priority": priority}
-                )
-                available_engines.append(engine_info)
-            except Exception as e:
-                available_engines.append(
-                    {
-                        "name": name,
-                        "id": name,
-                        "available": False,
-                        "priority": priority,
-                        "error": str(e),
-                    }
-                )
+        # Factories build no engines here: get_engine_info() returns a constant
+        # and is_available() is a cheap probe that reports errors as False
+        for factory, priority in self._engines.values():
+            engine_info = dict(factory.get_engine_info())
+            engine_info["available"] = factory.is_available(settings)
+            engine_info["priority"] = priority
+            available_engines.append(engine_info)
 
         # Sort by priority for consistent ordering
         available_engines.sort(key=lambda x: x.get("priority", 0), reverse=True)
@@ -99,7 +130,9 @@ class SpeechEngineRegistry(ISpeechEngineRegistry):
         """Unregister an engine by name"""
         if name in self._engines:
             del self._engines[name]
-            print(f"🗑️ Unregistered speech engine: {name}")
+            self._instances.pop(name, None)
+            self._best = None
+            logger.debug("Unregistered speech engine: %s", name)
             return True
         return False
 
@@ -120,4 +153,5 @@ class SpeechEngineRegistry(ISpeechEngineRegistry):
 
         factory, _ = self._engines[name]
         self._engines[name] = (factory, priority)
-        print(f"🔧 Updated {name} priority to {priority}")
+        self._best = None
+        logger.debug("Updated %s priority to %d", name, priority)
@@ -261,6 +261,7 @@ class SettingsView(QScrollArea):
     def on_refresh_devices(self):
         """Handle refresh button click"""
         print("Refreshing audio devices...")
+        self.audio_device_manager.refresh()
         self.update_microphone_dropdown()
 
     def on_setting_changed(self, key: str, value: str):